@@ -0,0 +1,414 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          API CORE MODULE
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+# Transport-free request flows shared by the blocking handlers in
+# api_handlers.py and the asyncio handlers in async_api_handlers.py.
+#
+# A flow is a generator that yields what it needs and receives the decoded
+# JSON back:
+#   - an ApiRequest is performed and its JSON payload sent back in
+#   - a nested flow is driven to completion and its return value sent back
+#   - a tuple of the above runs concurrently; a list of results comes back,
+#     with failed entries replaced by the exception they raised
+# Any other failure is thrown into the flow at the yield; transports raise
+# UpstreamError / UpstreamTimeout for network problems.
+#
+# Flows raise on failure (UpstreamError for transient problems, NotFound
+# for a definitive miss) rather than returning fallbacks, so failures are
+# never stored as results. Handlers map them back to the documented return
+# values with movie_error_result / empty_result / no_result.
+
+from typing import Any, Dict, Generator, List, NamedTuple, Optional, Tuple
+from config import API_KEYS, OMDB_BASE_URL, TMDB_BASE_URL, WATCHMODE_BASE_URL, YOUTUBE_BASE_URL
+
+Flow = Generator[Any, Any, Any]
+
+TIMEOUT_MESSAGE = "⏱️ Connection timed out. Please try again!"
+
+# OMDB's Error for an unknown title; other Response=False errors (quota,
+# invalid key) are transient upstream failures
+OMDB_NOT_FOUND = 'Movie not found!'
+
+# Sections fetched with every TMDB details call via append_to_response,
+# so one round-trip also covers recommendations and the trailer
+DETAIL_SECTIONS = ('recommendations', 'videos', 'release_dates', 'credits')
+
+
+class UpstreamError(Exception):
+    """Raised by a transport when an upstream request fails."""
+
+
+class UpstreamTimeout(UpstreamError):
+    """Raised by a transport when an upstream request times out."""
+
+
+class NotFound(Exception):
+    """Raised by a flow when the upstream has no match; carries the user-facing message."""
+
+
+class ApiRequest(NamedTuple):
+    """A single GET request, named by endpoint for pooling and timeouts."""
+    endpoint: str
+    url: str
+    params: Dict
+
+
+def network_error_message(error: Exception) -> str:
+    """Formats the user-facing message for a failed lookup."""
+    return f"🌐 Network error: {error}"
+
+
+def not_found_message(movie_title: str) -> str:
+    """Formats the user-facing message for an unknown title."""
+    return f"❌ Movie '{movie_title}' not found. Try checking the spelling!"
+
+
+def movie_error_result(error: Exception) -> Tuple[None, str]:
+    """Maps a failed movie lookup to the (None, error_message) contract."""
+    if isinstance(error, NotFound):
+        return None, str(error)
+    if isinstance(error, UpstreamTimeout):
+        return None, TIMEOUT_MESSAGE
+    return None, network_error_message(error)
+
+
+def empty_result(error: Exception) -> Tuple:
+    """Fallback for list fetchers: a failed lookup renders as no results (read-only, like cache hits)."""
+    return ()
+
+
+def no_result(error: Exception) -> None:
+    """Fallback for single-value fetchers."""
+    return None
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Request Builders
+# ──────────────────────────────────────────────────────────────────────────────
+
+def omdb_request(**params) -> ApiRequest:
+    """Builds an OMDB request with the API key attached."""
+    return ApiRequest('omdb', OMDB_BASE_URL, {**params, 'apikey': API_KEYS['omdb']})
+
+
+def tmdb_request(endpoint: str, path: str, **params) -> ApiRequest:
+    """Builds a TMDB request for `path` with the API key attached."""
+    return ApiRequest(endpoint, f"{TMDB_BASE_URL}{path}", {**params, 'api_key': API_KEYS['tmdb']})
+
+
+def tmdb_details_request(tmdb_id: int) -> ApiRequest:
+    """Builds the consolidated TMDB details request (see DETAIL_SECTIONS)."""
+    return tmdb_request('tmdb.details', f"movie/{tmdb_id}", append_to_response=','.join(DETAIL_SECTIONS))
+
+
+def watchmode_request(path: str, **params) -> ApiRequest:
+    """Builds a Watchmode request for `path` with the API key attached."""
+    return ApiRequest('watchmode', f"{WATCHMODE_BASE_URL}{path}", {**params, 'apiKey': API_KEYS['watchmode']})
+
+
+def youtube_request(path: str, **params) -> ApiRequest:
+    """Builds a YouTube Data API request for `path` with the API key attached."""
+    return ApiRequest('youtube', f"{YOUTUBE_BASE_URL}{path}", {**params, 'key': API_KEYS['youtube']})
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Parsers
+# ──────────────────────────────────────────────────────────────────────────────
+
+def _release_year(movie: Dict) -> str:
+    return movie.get('release_date', 'N/A')[:4] if movie.get('release_date') else 'N/A'
+
+
+def _thumbnail_url(poster_path: Optional[str]) -> Optional[str]:
+    return f"https://image.tmdb.org/t/p/w92{poster_path}" if poster_path else None
+
+
+def parsed(parser, data: Any) -> Any:
+    """Applies a parser, reporting malformed payloads as upstream errors."""
+    try:
+        return parser(data)
+    except (AttributeError, KeyError, TypeError, ValueError) as error:
+        raise UpstreamError(f"Malformed response: {error!r}") from error
+
+
+def parse_suggestions(data: Dict, limit: Optional[int] = 8) -> List[Dict]:
+    """Converts a TMDB search payload into suggestion dicts (first `limit`; None for all)."""
+    return [
+        {
+            'id': movie['id'],
+            'title': movie['title'],
+            'year': _release_year(movie),
+            'poster': _thumbnail_url(movie.get('poster_path')),
+            'rating': movie.get('vote_average', 0)
+        }
+        for movie in data.get('results', [])[:limit]
+    ]
+
+
+def parse_trending(data: Dict) -> List[Dict]:
+    """Converts a TMDB trending payload into display dicts."""
+    return [
+        {
+            'id': movie['id'],
+            'title': movie['title'],
+            'year': _release_year(movie),
+            'poster': _thumbnail_url(movie.get('poster_path')),
+            'rating': round(movie.get('vote_average', 0), 1)
+        }
+        for movie in data.get('results', [])[:10]
+    ]
+
+
+def suggestion_from_movie(movie_data: Dict) -> Optional[Dict]:
+    """Builds a suggestion dict from merged movie data, if it has a TMDB ID."""
+    if not movie_data.get('tmdb_id') or not movie_data.get('Title'):
+        return None
+    return {
+        'id': movie_data['tmdb_id'],
+        'title': movie_data['Title'],
+        'year': (movie_data.get('Year') or '')[:4],
+        'poster': _thumbnail_url(movie_data.get('poster_path')),
+        'rating': movie_data.get('vote_average', 0)
+    }
+
+
+def parse_tmdb_trailer(data: Dict) -> Optional[str]:
+    """
+    Picks the best YouTube trailer from a TMDB videos payload.
+
+    Official trailers win over other trailers, trailers over teasers.
+    """
+    videos = [video for video in data.get('results', []) if video.get('site') == 'YouTube' and video.get('key')]
+    ranked = sorted(
+        (video for video in videos if video.get('type') in ('Trailer', 'Teaser')),
+        key=lambda video: (video['type'] != 'Trailer', not video.get('official'))
+    )
+    return f"https://youtube.com/watch?v={ranked[0]['key']}" if ranked else None
+
+
+def parse_youtube_trailer(data: Dict) -> Optional[str]:
+    """Takes the first video of a YouTube search payload as a watch URL."""
+    if 'error' in data:
+        raise UpstreamError(data['error'].get('message', 'YouTube API error'))
+    items = data.get('items', [])
+    return f"https://youtube.com/watch?v={items[0]['id']['videoId']}" if items else None
+
+
+def parse_streaming_sources(data: Dict) -> List[Dict]:
+    """Keeps one entry per subscription source from a Watchmode payload."""
+    unique_sources = {}
+
+    for source in data.get('sources', []):
+        if source.get('type') == 'sub':
+            source_id = source['source_id']
+            if source_id not in unique_sources:
+                unique_sources[source_id] = {
+                    'name': source['name'],
+                    'url': source['web_url']
+                }
+
+    return list(unique_sources.values())
+
+
+def pop_detail_sections(movie_data: Dict) -> Dict[str, Any]:
+    """
+    Removes the appended sections that have their own fetchers.
+
+    'recommendations' and 'videos' come back parsed the way
+    recommendations_flow and the TMDB trailer tier parse them; credits and
+    release dates stay on the movie data.
+
+    Returns:
+        Dict with 'recommendations' (list) and 'trailer' (URL or None)
+        for each section that was present
+    """
+    sections = {}
+    recommendations = movie_data.pop('recommendations', None)
+    if isinstance(recommendations, dict):
+        sections['recommendations'] = recommendations.get('results', [])
+    videos = movie_data.pop('videos', None)
+    if isinstance(videos, dict):
+        sections['trailer'] = parse_tmdb_trailer(videos)
+    return sections
+
+
+def merge_movie_data(omdb_data: Dict, tmdb_details: Optional[Dict]) -> Dict:
+    """Overlays OMDB fields on TMDB details; OMDB wins on shared keys."""
+    if not tmdb_details or not tmdb_details.get('id'):
+        return omdb_data
+
+    movie_data = {**tmdb_details, **omdb_data}
+    movie_data['tmdb_id'] = tmdb_details['id']
+    return movie_data
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Flows
+# ──────────────────────────────────────────────────────────────────────────────
+
+def omdb_lookup_flow(movie_title: str, outcome: Dict) -> Flow:
+    """Looks a title up on OMDB, noting in `outcome['omdb_matched']` whether it matched."""
+    try:
+        omdb_data = yield omdb_request(t=movie_title, plot='full')
+    except Exception:
+        outcome['omdb_matched'] = False
+        raise
+    outcome['omdb_matched'] = omdb_data.get('Response') != 'False'
+    return omdb_data
+
+
+def tmdb_details_by_title_flow(movie_title: str, outcome: Optional[Dict] = None) -> Flow:
+    """
+    Speculatively resolves a title on TMDB without waiting for OMDB.
+
+    The top search hit's details carry its `imdb_id`, which the caller
+    checks against OMDB's answer before using them. When the concurrent
+    omdb_lookup_flow sharing `outcome` has already missed, the remaining
+    requests are skipped, since their answer would be discarded.
+    """
+    def omdb_missed() -> bool:
+        return outcome is not None and outcome.get('omdb_matched') is False
+
+    if omdb_missed():
+        return None
+    search = yield tmdb_request('tmdb.search', 'search/movie', query=movie_title, page=1)
+    results = search.get('results', [])
+
+    if not results or omdb_missed():
+        return None
+    return (yield tmdb_details_request(results[0]['id']))
+
+
+def tmdb_details_by_imdb_id_flow(imdb_id: str) -> Flow:
+    """Resolves an IMDb ID through TMDB /find, then fetches its details."""
+    tmdb_data = yield tmdb_request('tmdb.find', f"find/{imdb_id}", external_source='imdb_id')
+
+    if not tmdb_data.get('movie_results'):
+        return None
+    return (yield tmdb_details_request(tmdb_data['movie_results'][0]['id']))
+
+
+def movie_data_flow(movie_title: str) -> Flow:
+    """
+    Looks a title up on OMDB and enriches it with TMDB details.
+
+    The OMDB lookup and a speculative TMDB search+details lookup run
+    concurrently. If TMDB's top hit has the same IMDb ID as OMDB's answer
+    it is used directly; otherwise TMDB is queried by IMDb ID. The
+    speculative details request is dropped once OMDB has missed.
+
+    Returns:
+        Tuple of (movie_data_dict, None); NotFound or UpstreamError is
+        raised instead of returning an error tuple (see movie_error_result)
+    """
+    outcome = {}
+    omdb_lookup = omdb_lookup_flow(movie_title, outcome)
+
+    if API_KEYS['tmdb']:
+        omdb_data, tmdb_details = yield (omdb_lookup, tmdb_details_by_title_flow(movie_title, outcome))
+    else:
+        omdb_data, tmdb_details = (yield (omdb_lookup,))[0], None
+
+    if isinstance(omdb_data, Exception):
+        raise omdb_data
+
+    if omdb_data.get('Response') == 'False':
+        # Quota and key errors also come back as Response=False; only a miss is definitive
+        if omdb_data.get('Error') == OMDB_NOT_FOUND:
+            raise NotFound(not_found_message(movie_title))
+        raise UpstreamError(f"omdb: {omdb_data.get('Error', 'request failed')}")
+
+    imdb_id = omdb_data.get('imdbID')
+    if not imdb_id or not API_KEYS['tmdb']:
+        return omdb_data, None
+
+    try:
+        if isinstance(tmdb_details, Exception) or not tmdb_details or tmdb_details.get('imdb_id') != imdb_id:
+            tmdb_details = yield tmdb_details_by_imdb_id_flow(imdb_id)
+    except Exception:
+        tmdb_details = None  # Continue with OMDB data only
+
+    return merge_movie_data(omdb_data, tmdb_details), None
+
+
+def search_suggestions_flow(query: str) -> Flow:
+    """Fetches up to 8 TMDB suggestions for a query of 2+ characters."""
+    if not query or len(query) < 2:
+        return []
+
+    data = yield tmdb_request('tmdb.search', 'search/movie', query=query, page=1)
+    return parsed(parse_suggestions, data)
+
+
+def trending_movies_flow() -> Flow:
+    """Fetches this week's top 10 trending movies from TMDB."""
+    data = yield tmdb_request('tmdb.trending', 'trending/movie/week')
+    return parsed(parse_trending, data)
+
+
+def movies_by_genre_flow(genre_id: int, page: int = 1) -> Flow:
+    """Fetches one page (20 movies) of a TMDB genre, most popular first."""
+    data = yield tmdb_request('tmdb.discover', 'discover/movie', with_genres=genre_id,
+                              sort_by='popularity.desc', page=page)
+    return parsed(lambda payload: payload.get('results', []), data)
+
+
+def discover_flow(params: Dict[str, Any], page: int = 1) -> Flow:
+    """
+    Runs one page of a TMDB /discover query.
+
+    Returns:
+        Tuple of (movies, total_pages)
+    """
+    data = yield tmdb_request('tmdb.discover', 'discover/movie', **params, page=page)
+    return parsed(lambda payload: (payload.get('results', []), int(payload.get('total_pages', 0))), data)
+
+
+def recommendations_flow(tmdb_id: int) -> Flow:
+    """Fetches TMDB recommendations for a TMDB movie ID."""
+    if not tmdb_id:
+        return []
+
+    data = yield tmdb_request('tmdb.recommendations', f"movie/{tmdb_id}/recommendations")
+    return parsed(lambda payload: payload.get('results', []), data)
+
+
+def streaming_info_flow(imdb_id: str) -> Flow:
+    """Fetches subscription streaming sources from Watchmode."""
+    if not imdb_id:
+        return []
+
+    data = yield watchmode_request(f"title/{imdb_id}/details/", append_to_response='sources')
+    return parsed(parse_streaming_sources, data)
+
+
+def trailer_flow(title: str, year: str, tmdb_id: Optional[int] = None) -> Flow:
+    """
+    Resolves a trailer from TMDB videos first, YouTube search second.
+
+    TMDB's videos list is free and fast; YouTube search costs quota, so it
+    only runs when TMDB has no trailer or fails.
+
+    Returns:
+        Tuple of (trailer_url or None, source) where source is 'tmdb',
+        'youtube' or 'not_found'
+    """
+    if tmdb_id:
+        try:
+            data = yield tmdb_request('tmdb.videos', f"movie/{tmdb_id}/videos")
+            trailer_url = parsed(parse_tmdb_trailer, data)
+            if trailer_url:
+                return trailer_url, 'tmdb'
+        except UpstreamError:
+            pass  # Fall back to YouTube search
+
+    trailer_url = yield youtube_trailer_flow(title, year)
+    return trailer_url, 'youtube' if trailer_url else 'not_found'
+
+
+def youtube_trailer_flow(title: str, year: str) -> Flow:
+    """Searches YouTube for the official trailer; None when nothing matches."""
+    data = yield youtube_request('search', q=f"{title} {year} Official Trailer",
+                                 part='snippet', type='video', maxResults=1)
+    return parsed(parse_youtube_trailer, data)
@@ -4,323 +4,230 @@
 
 import streamlit as st
 import requests
-from typing import Dict, Optional, List, Tuple
-from config import API_KEYS
+from typing import Any, Dict, Optional, List, Tuple
+import api_core
+import http_client
+from api_core import (
+    ApiRequest, Flow, UpstreamError, UpstreamTimeout,
+    empty_result, movie_error_result, no_result
+)
+from enrichment import in_worker_thread, run_stage, submit
+from config import GENRE_CACHE_TTL, STALE_FRONT_TTL, TRENDING_CACHE_TTL, ZERO_COPY_CACHE
+from movie_record import MOVIE_RECORDS_NAMESPACE, MovieRecord, persist_payload
+from negative_cache import negative_cached
+from record_store import freeze, movie_records
+from response_cache import get_cache, persistent_cache
+from shared_cache import shared_cache
+from singleflight import single_flight
+from suggestion_index import merge_suggestions, suggestion_index
+from title_index import canonicalize_title, title_aliases
+from trailer_resolver import resolve_trailer, seed_trailer, trailer_key
 
+# ──────────────────────────────────────────────────────────────────────────────
+# Blocking Flow Driver
+# ──────────────────────────────────────────────────────────────────────────────
 
-@st.cache_data(ttl=3600)
-def fetch_movie_data(movie_title: str) -> Tuple[Optional[Dict], Optional[str]]:
+def _fetch_json(request: ApiRequest) -> Dict:
+    response = http_client.get(request.endpoint, request.url, request.params)
+    response.raise_for_status()  # 401/429/5xx bodies are errors, not empty results
+    return response.json()
+
+
+def _perform(request: ApiRequest) -> Dict:
     """
-    Fetches movie information from OMDB and TMDB APIs.
+    Performs one request through the pooled client and decodes its JSON.
     
-    Args:
-        movie_title: Title of the movie to search for
-        
-    Returns:
-        Tuple of (movie_data_dict, error_message)
+    Non-2xx responses raise UpstreamError, so they are never cached as
+    results and fall to the transient negative cache instead.
     """
     try:
-        # OMDB API call
-        omdb_url = f"http://www.omdbapi.com/?t={movie_title}&plot=full&apikey={API_KEYS['omdb']}"
-        omdb_response = requests.get(omdb_url, timeout=15)
-        omdb_data = omdb_response.json()
-        
-        if omdb_data.get('Response') == 'False':
-            return None, f"❌ Movie '{movie_title}' not found. Try checking the spelling!"
-        
-        movie_data = omdb_data
-        imdb_id = movie_data.get('imdbID')
-        
-        # Try to fetch additional data from TMDB
-        if imdb_id and API_KEYS['tmdb']:
-            try:
-                tmdb_find_url = f"https://api.themoviedb.org/3/find/{imdb_id}?api_key={API_KEYS['tmdb']}&external_source=imdb_id"
-                tmdb_response = requests.get(tmdb_find_url, timeout=15)
-                tmdb_data = tmdb_response.json()
-                
-                if tmdb_data.get('movie_results'):
-                    tmdb_id = tmdb_data['movie_results'][0]['id']
-                    tmdb_details_url = f"https://api.themoviedb.org/3/movie/{tmdb_id}?api_key={API_KEYS['tmdb']}"
-                    tmdb_details = requests.get(tmdb_details_url, timeout=15).json()
-                    movie_data = {**tmdb_details, **movie_data}
-                    movie_data['tmdb_id'] = tmdb_id
-            except:
-                pass  # Continue with OMDB data only
-        
-        return movie_data, None
-        
-    except requests.exceptions.Timeout:
-        return None, "⏱️ Connection timed out. Please try again!"
-    except requests.exceptions.RequestException as error:
-        return None, f"🌐 Network error: {error}"
+        return run_stage(request.endpoint, lambda: _fetch_json(request))
+    except requests.exceptions.Timeout as error:
+        raise UpstreamTimeout(str(error)) from error
+    except (requests.exceptions.RequestException, ValueError) as error:
+        raise UpstreamError(str(error)) from error
 
 
-@st.cache_data(ttl=300)
-def fetch_search_suggestions(query: str) -> List[Dict]:
-    """
-    Fetches search suggestions as user types using TMDB API.
-    
-    Args:
-        query: Search query string
-        
-    Returns:
-        List of suggestion dictionaries
-    """
-    if not query or len(query) < 2:
-        return []
-    
+def _resolve_or_error(step: Any) -> Any:
     try:
-        url = f"https://api.themoviedb.org/3/search/movie?api_key={API_KEYS['tmdb']}&query={query}&page=1"
-        response = requests.get(url, timeout=5)
-        data = response.json()
-        
-        suggestions = []
-        for movie in data.get('results', [])[:8]:
-            poster_path = movie.get('poster_path')
-            suggestions.append({
-                'id': movie['id'],
-                'title': movie['title'],
-                'year': movie.get('release_date', 'N/A')[:4] if movie.get('release_date') else 'N/A',
-                'poster': f"https://image.tmdb.org/t/p/w92{poster_path}" if poster_path else None,
-                'rating': movie.get('vote_average', 0)
-            })
-        
-        return suggestions
-    except:
-        return []
+        return _resolve(step)
+    except Exception as error:
+        return error
 
 
-@st.cache_data(ttl=3600)
-def fetch_trending_movies() -> List[Dict]:
-    """
-    Fetches trending movies from TMDB API.
+def _resolve(step: Any) -> Any:
+    """Resolves one yielded step of a flow (see api_core)."""
+    if isinstance(step, ApiRequest):
+        return _perform(step)
     
-    Returns:
-        List of trending movie dictionaries
-    """
-    try:
-        url = f"https://api.themoviedb.org/3/trending/movie/week?api_key={API_KEYS['tmdb']}"
-        response = requests.get(url, timeout=10)
-        data = response.json()
-        
-        trending = []
-        for movie in data.get('results', [])[:10]:
-            poster_path = movie.get('poster_path')
-            trending.append({
-                'id': movie['id'],
-                'title': movie['title'],
-                'year': movie.get('release_date', 'N/A')[:4] if movie.get('release_date') else 'N/A',
-                'poster': f"https://image.tmdb.org/t/p/w92{poster_path}" if poster_path else None,
-                'rating': round(movie.get('vote_average', 0), 1)
-            })
-        
-        return trending
-    except:
-        return []
+    if isinstance(step, tuple):
+        # Nested fan-outs run inline so pool workers never block on the pool
+        if len(step) == 1 or in_worker_thread():
+            return [_resolve_or_error(part) for part in step]
+        futures = [submit(_resolve_or_error, part) for part in step[1:]]
+        return [_resolve_or_error(step[0])] + [future.result() for future in futures]
+    
+    return run_flow(step)
 
 
-@st.cache_data(ttl=3600)
-def fetch_movies_by_genre(genre_id: int) -> List[Dict]:
+def run_flow(flow: Flow) -> Any:
     """
-    Fetches movies by genre from TMDB API.
+    Drives an api_core flow to completion with blocking requests.
     
     Args:
-        genre_id: TMDB genre ID
+        flow: Generator flow from api_core
         
     Returns:
-        List of movie dictionaries
+        The flow's return value
     """
     try:
-        url = f"https://api.themoviedb.org/3/discover/movie?api_key={API_KEYS['tmdb']}&with_genres={genre_id}&sort_by=popularity.desc"
-        response = requests.get(url, timeout=10)
-        return response.json().get('results', [])[:10]
-    except:
-        return []
+        step = next(flow)
+        while True:
+            try:
+                value = _resolve(step)
+            except Exception as error:
+                step = flow.throw(error)
+            else:
+                step = flow.send(value)
+    except StopIteration as stop:
+        return stop.value
 
 
-@st.cache_data(ttl=3600)
-def fetch_recommendations(tmdb_id: int) -> List[Dict]:
+# ──────────────────────────────────────────────────────────────────────────────
+# Fetchers
+# ──────────────────────────────────────────────────────────────────────────────
+
+def memory_cache(ttl: Optional[float] = None):
     """
-    Gets similar movie recommendations from TMDB API.
+    The in-memory tier above each fetcher's persistent tier.
     
-    Args:
-        tmdb_id: TMDB movie ID
-        
-    Returns:
-        List of recommendation movie dictionaries
+    With ZERO_COPY_CACHE, hits return one frozen object shared by all
+    sessions (see shared_cache); otherwise st.cache_data, which hands each
+    caller its own unpickled copy. Either way callers treat fetcher
+    results as read-only: fallbacks (empty_result, DetailBundle defaults)
+    are empty tuples, and suggestions are frozen on every path.
     """
-    if not tmdb_id:
-        return []
-    
-    try:
-        url = f"https://api.themoviedb.org/3/movie/{tmdb_id}/recommendations?api_key={API_KEYS['tmdb']}"
-        response = requests.get(url, timeout=10)
-        return response.json().get('results', [])
-    except:
-        return []
+    if ZERO_COPY_CACHE:
+        return shared_cache(ttl=ttl)
+    return st.cache_data(ttl=ttl)
 
 
-@st.cache_data(ttl=86400)
-def fetch_streaming_info(imdb_id: str) -> List[Dict]:
+def fetch_movie_data(movie_title: str) -> Tuple[Optional[MovieRecord], Optional[str]]:
     """
-    Gets streaming availability information from Watchmode API.
+    Fetches movie information from OMDB and TMDB APIs.
+    
+    Queries are canonicalized first, so case, spacing, accents and
+    punctuation variants of a title share one cache entry.
     
     Args:
-        imdb_id: IMDb ID of the movie
+        movie_title: Title of the movie to search for
         
     Returns:
-        List of streaming source dictionaries
+        Tuple of (movie_record, error_message); the MovieRecord comes from
+        the shared record store, the same object for every session viewing
+        the movie
     """
-    if not imdb_id:
-        return []
-    
-    try:
-        url = f"https://api.watchmode.com/v1/title/{imdb_id}/details/?apiKey={API_KEYS['watchmode']}&append_to_response=sources"
-        response = requests.get(url, timeout=10)
-        data = response.json()
-        
-        sources = data.get('sources', [])
-        unique_sources = {}
-        
-        for source in sources:
-            if source.get('type') == 'sub':
-                source_id = source['source_id']
-                if source_id not in unique_sources:
-                    unique_sources[source_id] = {
-                        'name': source['name'],
-                        'url': source['web_url']
-                    }
-        
-        return list(unique_sources.values())
-    except:
-        return []
+    movie_data, error = _fetch_movie_data(canonicalize_title(movie_title), movie_title)
+    if movie_data:
+        movie_data = movie_records.share(movie_data)
+    return movie_data, error
 
 
-@st.cache_data
-def fetch_youtube_trailer(title: str, year: str) -> Optional[str]:
+@negative_cached(movie_error_result, key_func=lambda query_key, _movie_title: query_key)
+@memory_cache(ttl=3600)
+def _fetch_movie_data(query_key: str, _movie_title: str) -> Tuple[Optional[MovieRecord], Optional[str]]:
     """
-    Searches YouTube for the official movie trailer.
+    Resolves a canonical query through the alias index before going upstream.
     
-    Args:
-        title: Movie title
-        year: Movie year
-        
-    Returns:
-        YouTube trailer URL or None
+    Full payloads are persisted once per imdbID; every query that resolved
+    to that imdbID is an alias serving the same record. Only the compact
+    MovieRecord is returned, so that is all the in-memory tier holds.
     """
-    try:
-        from googleapiclient.discovery import build
-        
-        youtube = build('youtube', 'v3', developerKey=API_KEYS['youtube'])
-        search_query = f"{title} {year} Official Trailer"
-        
-        search_response = youtube.search().list(
-            q=search_query,
-            part="snippet",
-            type="video",
-            maxResults=1
-        ).execute()
-        
-        if search_response['items']:
-            video_id = search_response['items'][0]['id']['videoId']
-            return f"https://youtube.com/watch?v={video_id}"
-        return None
-    except:
-        return None
+    imdb_id = title_aliases.resolve(query_key)
+    if imdb_id:
+        try:
+            hit, movie_data = get_cache().get(MOVIE_RECORDS_NAMESPACE, imdb_id)
+            if hit:
+                return MovieRecord.from_payload(movie_data), None
+        except Exception:
+            pass  # Fall through to the upstream lookup
+    
+    movie_data, error = _fetch_movie_data_upstream(query_key, _movie_title)
+    
+    if movie_data and movie_data.get('imdbID'):
+        imdb_id = movie_data['imdbID']
+        title_aliases.add(query_key, imdb_id)
+        title_aliases.add(canonicalize_title(movie_data.get('Title', '')), imdb_id)
+        suggestion = api_core.suggestion_from_movie(movie_data)
+        if suggestion:
+            suggestion_index.add([suggestion])
+        persist_payload(movie_data)
+    
+    return (MovieRecord.from_payload(movie_data) if movie_data else None), error
 
-# ═══════════════════════════════════════════════════════════════════════════════
-#                          API HANDLERS MODULE
-# ═══════════════════════════════════════════════════════════════════════════════
 
-import streamlit as st
-import requests
-from typing import Dict, Optional, List, Tuple
-from config import API_KEYS
+@single_flight(key_func=lambda query_key, movie_title: query_key)
+def _fetch_movie_data_upstream(query_key: str, movie_title: str) -> Tuple[Optional[Dict], Optional[str]]:
+    """Runs the OMDB/TMDB lookup once per canonical query in flight."""
+    movie_data, error = run_flow(api_core.movie_data_flow(movie_title))
+    if movie_data:
+        _fan_out_detail_sections(movie_data)
+    return movie_data, error
 
 
-@st.cache_data(ttl=3600)
-def fetch_movie_data(movie_title: str) -> Tuple[Optional[Dict], Optional[str]]:
+def _fan_out_detail_sections(movie_data: Dict):
     """
-    Fetches movie information from OMDB and TMDB APIs.
+    Moves the sections appended to the TMDB details call into their own caches.
     
-    Args:
-        movie_title: Title of the movie to search for
-        
-    Returns:
-        Tuple of (movie_data_dict, error_message)
+    Afterwards fetch_recommendations and fetch_youtube_trailer are cache
+    hits for this movie instead of separate round-trips.
     """
-    try:
-        # OMDB API call
-        omdb_url = f"http://www.omdbapi.com/?t={movie_title}&plot=full&apikey={API_KEYS['omdb']}"
-        omdb_response = requests.get(omdb_url, timeout=15)
-        omdb_data = omdb_response.json()
-        
-        if omdb_data.get('Response') == 'False':
-            return None, f"❌ Movie '{movie_title}' not found. Try checking the spelling!"
-        
-        movie_data = omdb_data
-        imdb_id = movie_data.get('imdbID')
-        
-        # Try to fetch additional data from TMDB
-        if imdb_id and API_KEYS['tmdb']:
-            try:
-                tmdb_find_url = f"https://api.themoviedb.org/3/find/{imdb_id}?api_key={API_KEYS['tmdb']}&external_source=imdb_id"
-                tmdb_response = requests.get(tmdb_find_url, timeout=15)
-                tmdb_data = tmdb_response.json()
-                
-                if tmdb_data.get('movie_results'):
-                    tmdb_id = tmdb_data['movie_results'][0]['id']
-                    tmdb_details_url = f"https://api.themoviedb.org/3/movie/{tmdb_id}?api_key={API_KEYS['tmdb']}"
-                    tmdb_details = requests.get(tmdb_details_url, timeout=15).json()
-                    movie_data = {**tmdb_details, **movie_data}
-                    movie_data['tmdb_id'] = tmdb_id
-            except:
-                pass  # Continue with OMDB data only
-        
-        return movie_data, None
-        
-    except requests.exceptions.Timeout:
-        return None, "⏱️ Connection timed out. Please try again!"
-    except requests.exceptions.RequestException as error:
-        return None, f"🌐 Network error: {error}"
+    sections = api_core.pop_detail_sections(movie_data)
+    tmdb_id, imdb_id = movie_data.get('tmdb_id'), movie_data.get('imdbID')
+    
+    if tmdb_id and 'recommendations' in sections:
+        fetch_recommendations.seed(sections['recommendations'], tmdb_id)
+    if imdb_id and sections.get('trailer'):
+        seed_trailer(imdb_id, sections['trailer'])
 
 
-@st.cache_data(ttl=300)
 def fetch_search_suggestions(query: str) -> List[Dict]:
     """
-    Fetches search suggestions as user types using TMDB API.
+    Fetches search suggestions as user types.
+    
+    Answered from the local suggestion index when TMDB has already fully
+    answered a prefix of the query; otherwise TMDB's results come first,
+    topped up with any indexed matches they lack.
     
     Args:
         query: Search query string
         
     Returns:
-        List of suggestion dictionaries
+        Tuple of read-only suggestion mappings
     """
     if not query or len(query) < 2:
-        return []
+        return ()
     
-    try:
-        url = f"https://api.themoviedb.org/3/search/movie?api_key={API_KEYS['tmdb']}&query={query}&page=1"
-        response = requests.get(url, timeout=5)
-        data = response.json()
-        
-        suggestions = []
-        for movie in data.get('results', [])[:8]:
-            poster_path = movie.get('poster_path')
-            suggestions.append({
-                'id': movie['id'],
-                'title': movie['title'],
-                'year': movie.get('release_date', 'N/A')[:4] if movie.get('release_date') else 'N/A',
-                'poster': f"https://image.tmdb.org/t/p/w92{poster_path}" if poster_path else None,
-                'rating': movie.get('vote_average', 0)
-            })
-        
-        return suggestions
-    except:
-        return []
+    local = suggestion_index.search(query)
+    if local is not None:
+        return freeze(local)
+    return freeze(merge_suggestions(_fetch_search_suggestions(query), suggestion_index.provisional(query)))
+
 
+@negative_cached(empty_result)
+@memory_cache(ttl=300)
+@single_flight()
+def _fetch_search_suggestions(query: str) -> List[Dict]:
+    """Asks TMDB for suggestions and records them in the local index."""
+    suggestions = run_flow(api_core.search_suggestions_flow(query))
+    suggestion_index.record_search(query, suggestions)
+    return suggestions
 
-@st.cache_data(ttl=3600)
+
+@negative_cached(empty_result)
+@memory_cache(ttl=STALE_FRONT_TTL)
+@persistent_cache(ttl=TRENDING_CACHE_TTL, stale_while_revalidate=True)
+@single_flight()
 def fetch_trending_movies() -> List[Dict]:
     """
     Fetches trending movies from TMDB API.
@@ -328,47 +235,54 @@ def fetch_trending_movies() -> List[Dict]:
     Returns:
         List of trending movie dictionaries
     """
-    try:
-        url = f"https://api.themoviedb.org/3/trending/movie/week?api_key={API_KEYS['tmdb']}"
-        response = requests.get(url, timeout=10)
-        data = response.json()
-        
-        trending = []
-        for movie in data.get('results', [])[:10]:
-            poster_path = movie.get('poster_path')
-            trending.append({
-                'id': movie['id'],
-                'title': movie['title'],
-                'year': movie.get('release_date', 'N/A')[:4] if movie.get('release_date') else 'N/A',
-                'poster': f"https://image.tmdb.org/t/p/w92{poster_path}" if poster_path else None,
-                'rating': round(movie.get('vote_average', 0), 1)
-            })
-        
-        return trending
-    except:
-        return []
+    movies = run_flow(api_core.trending_movies_flow())
+    suggestion_index.add(movies)
+    return movies
 
 
-@st.cache_data(ttl=3600)
-def fetch_movies_by_genre(genre_id: int) -> List[Dict]:
+@negative_cached(empty_result)
+@memory_cache(ttl=3600)
+@persistent_cache(ttl=GENRE_CACHE_TTL, stale_while_revalidate=True)
+@single_flight()
+def fetch_movies_by_genre(genre_id: int, page: int = 1) -> List[Dict]:
     """
     Fetches movies by genre from TMDB API.
     
+    genre_warmer keeps the first GENRE_WARM_PAGES pages of every genre
+    seeded, so these are normally persistent cache hits.
+    
     Args:
         genre_id: TMDB genre ID
+        page: Result page, 20 movies each, most popular first
         
     Returns:
         List of movie dictionaries
     """
-    try:
-        url = f"https://api.themoviedb.org/3/discover/movie?api_key={API_KEYS['tmdb']}&with_genres={genre_id}&sort_by=popularity.desc"
-        response = requests.get(url, timeout=10)
-        return response.json().get('results', [])[:10]
-    except:
-        return []
+    return run_flow(api_core.movies_by_genre_flow(genre_id, page))
+
+
+@negative_cached(lambda error: ((), 0))
+@memory_cache(ttl=3600)
+@persistent_cache(ttl=GENRE_CACHE_TTL)
+@single_flight()
+def fetch_discover_page(params: Tuple[Tuple[str, Any], ...], page: int) -> Tuple[List[Dict], int]:
+    """
+    Fetches one page of a TMDB /discover query.
+    
+    Args:
+        params: Discover parameters as sorted (name, value) pairs (see query_planner)
+        page: Result page, 1-based
+        
+    Returns:
+        Tuple of (movie dictionaries, total_pages)
+    """
+    return run_flow(api_core.discover_flow(dict(params), page))
 
 
-@st.cache_data(ttl=3600)
+@negative_cached(empty_result)
+@memory_cache(ttl=STALE_FRONT_TTL)
+@persistent_cache(ttl=3600, stale_while_revalidate=True)
+@single_flight()
 def fetch_recommendations(tmdb_id: int) -> List[Dict]:
     """
     Gets similar movie recommendations from TMDB API.
@@ -379,18 +293,13 @@ def fetch_recommendations(tmdb_id: int) -> List[Dict]:
     Returns:
         List of recommendation movie dictionaries
     """
-    if not tmdb_id:
-        return []
-    
-    try:
-        url = f"https://api.themoviedb.org/3/movie/{tmdb_id}/recommendations?api_key={API_KEYS['tmdb']}"
-        response = requests.get(url, timeout=10)
-        return response.json().get('results', [])
-    except:
-        return []
+    return run_flow(api_core.recommendations_flow(tmdb_id))
 
 
-@st.cache_data(ttl=86400)
+@negative_cached(empty_result)
+@memory_cache(ttl=86400)
+@persistent_cache(ttl=86400)
+@single_flight()
 def fetch_streaming_info(imdb_id: str) -> List[Dict]:
     """
     Gets streaming availability information from Watchmode API.
@@ -401,59 +310,28 @@ def fetch_streaming_info(imdb_id: str) -> List[Dict]:
     Returns:
         List of streaming source dictionaries
     """
-    if not imdb_id:
-        return []
-    
-    try:
-        url = f"https://api.watchmode.com/v1/title/{imdb_id}/details/?apiKey={API_KEYS['watchmode']}&append_to_response=sources"
-        response = requests.get(url, timeout=10)
-        data = response.json()
-        
-        sources = data.get('sources', [])
-        unique_sources = {}
-        
-        for source in sources:
-            if source.get('type') == 'sub':
-                source_id = source['source_id']
-                if source_id not in unique_sources:
-                    unique_sources[source_id] = {
-                        'name': source['name'],
-                        'url': source['web_url']
-                    }
-        
-        return list(unique_sources.values())
-    except:
-        return []
+    return run_flow(api_core.streaming_info_flow(imdb_id))
 
 
-@st.cache_data
-def fetch_youtube_trailer(title: str, year: str) -> Optional[str]:
+@negative_cached(no_result, key_func=trailer_key)
+@memory_cache()
+@single_flight(key_func=trailer_key)
+def fetch_youtube_trailer(title: str, year: str, imdb_id: Optional[str] = None,
+                          tmdb_id: Optional[int] = None) -> Optional[str]:
     """
-    Searches YouTube for the official movie trailer.
+    Finds the official movie trailer on YouTube.
+    
+    TMDB's videos list is tried first when `tmdb_id` is known; YouTube
+    search is the fallback. Resolved trailers are persisted per imdbID
+    (see trailer_resolver).
     
     Args:
         title: Movie title
         year: Movie year
+        imdb_id: Optional IMDb ID, used as the persistent cache key
+        tmdb_id: Optional TMDB ID, enabling the TMDB videos lookup
         
     Returns:
         YouTube trailer URL or None
     """
-    try:
-        from googleapiclient.discovery import build
-        
-        youtube = build('youtube', 'v3', developerKey=API_KEYS['youtube'])
-        search_query = f"{title} {year} Official Trailer"
-        
-        search_response = youtube.search().list(
-            q=search_query,
-            part="snippet",
-            type="video",
-            maxResults=1
-        ).execute()
-        
-        if search_response['items']:
-            video_id = search_response['items'][0]['id']['videoId']
-            return f"https://youtube.com/watch?v={video_id}"
-        return None
-    except:
-        return None
+    return resolve_trailer(title, year, imdb_id, run_flow, tmdb_id)
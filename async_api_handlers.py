@@ -0,0 +1,232 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          ASYNC API HANDLERS MODULE
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+# asyncio counterparts of the fetchers in api_handlers.py for use outside
+# Streamlit. Both modules drive the same api_core flows, so return values
+# and error messages are identical; only the transport differs.
+
+import asyncio
+import time
+import weakref
+import aiohttp
+from typing import Any, Dict, List, Optional, Tuple
+import api_core
+from api_core import (
+    ApiRequest, Flow, UpstreamError, UpstreamTimeout,
+    empty_result, movie_error_result, no_result
+)
+from config import ASYNC_HTTP_LIMIT, ASYNC_HTTP_LIMIT_PER_HOST, HTTP_TIMEOUTS
+from enrichment import record_timing
+from movie_record import MovieRecord, persist_payload
+from negative_cache import negative_cached
+from title_index import canonicalize_title
+from trailer_resolver import record_resolution
+
+
+_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = weakref.WeakKeyDictionary()
+
+
+def get_session() -> aiohttp.ClientSession:
+    """
+    Returns the shared client session for the running event loop.
+
+    Returns:
+        aiohttp.ClientSession with a keep-alive connector
+    """
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(limit=ASYNC_HTTP_LIMIT, limit_per_host=ASYNC_HTTP_LIMIT_PER_HOST)
+        session = aiohttp.ClientSession(connector=connector)
+        _sessions[loop] = session
+    return session
+
+
+async def close_session():
+    """Closes the running loop's shared session, if one was opened."""
+    session = _sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None and not session.closed:
+        await session.close()
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Async Flow Driver
+# ──────────────────────────────────────────────────────────────────────────────
+
+async def _perform(request: ApiRequest, session: aiohttp.ClientSession) -> Dict:
+    """Performs one request on the session and decodes its JSON; non-2xx raises UpstreamError."""
+    timeout = aiohttp.ClientTimeout(total=HTTP_TIMEOUTS.get(request.endpoint, HTTP_TIMEOUTS['default']))
+    started = time.perf_counter()
+    try:
+        async with session.get(request.url, params=request.params, timeout=timeout) as response:
+            response.raise_for_status()
+            return await response.json(content_type=None)
+    except asyncio.TimeoutError as error:
+        raise UpstreamTimeout(f"{request.endpoint} timed out") from error
+    except (aiohttp.ClientError, ValueError) as error:
+        raise UpstreamError(str(error)) from error
+    finally:
+        record_timing(request.endpoint, time.perf_counter() - started)
+
+
+async def _resolve_or_error(step: Any, session: aiohttp.ClientSession) -> Any:
+    try:
+        return await _resolve(step, session)
+    except Exception as error:
+        return error
+
+
+async def _resolve(step: Any, session: aiohttp.ClientSession) -> Any:
+    """Resolves one yielded step of a flow (see api_core)."""
+    if isinstance(step, ApiRequest):
+        return await _perform(step, session)
+
+    if isinstance(step, tuple):
+        return list(await asyncio.gather(*(_resolve_or_error(part, session) for part in step)))
+
+    return await run_flow(step, session)
+
+
+async def run_flow(flow: Flow, session: Optional[aiohttp.ClientSession] = None) -> Any:
+    """
+    Drives an api_core flow to completion on the event loop.
+
+    Args:
+        flow: Generator flow from api_core
+        session: Client session to use; defaults to the loop's shared session
+
+    Returns:
+        The flow's return value
+    """
+    session = session or get_session()
+    try:
+        step = next(flow)
+        while True:
+            try:
+                value = await _resolve(step, session)
+            except Exception as error:
+                step = flow.throw(error)
+            else:
+                step = flow.send(value)
+    except StopIteration as stop:
+        return stop.value
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Fetchers
+# ──────────────────────────────────────────────────────────────────────────────
+
+@negative_cached(movie_error_result, key_func=lambda movie_title, session=None: canonicalize_title(movie_title))
+async def fetch_movie_data(movie_title: str, session: Optional[aiohttp.ClientSession] = None) -> Tuple[Optional[MovieRecord], Optional[str]]:
+    """
+    Fetches movie information from OMDB and TMDB APIs.
+
+    Args:
+        movie_title: Title of the movie to search for
+        session: Optional client session
+
+    Returns:
+        Tuple of (movie_record, error_message); as with the sync fetcher,
+        the full payload is persisted for the record's `raw`
+    """
+    movie_data, error = await run_flow(api_core.movie_data_flow(movie_title), session)
+    if movie_data:
+        api_core.pop_detail_sections(movie_data)
+        await asyncio.get_running_loop().run_in_executor(None, persist_payload, movie_data)
+        movie_data = MovieRecord.from_payload(movie_data)  # Same shape as the sync fetcher
+    return movie_data, error
+
+
+@negative_cached(empty_result, key_func=lambda query, session=None: query)
+async def fetch_search_suggestions(query: str, session: Optional[aiohttp.ClientSession] = None) -> List[Dict]:
+    """
+    Fetches search suggestions using TMDB API.
+
+    Args:
+        query: Search query string
+        session: Optional client session
+
+    Returns:
+        List of suggestion dictionaries
+    """
+    return await run_flow(api_core.search_suggestions_flow(query), session)
+
+
+@negative_cached(empty_result, key_func=lambda session=None: ())
+async def fetch_trending_movies(session: Optional[aiohttp.ClientSession] = None) -> List[Dict]:
+    """
+    Fetches trending movies from TMDB API.
+
+    Returns:
+        List of trending movie dictionaries
+    """
+    return await run_flow(api_core.trending_movies_flow(), session)
+
+
+@negative_cached(empty_result, key_func=lambda genre_id, session=None, page=1: (genre_id, page))
+async def fetch_movies_by_genre(genre_id: int, session: Optional[aiohttp.ClientSession] = None,
+                                page: int = 1) -> List[Dict]:
+    """
+    Fetches movies by genre from TMDB API.
+
+    Args:
+        genre_id: TMDB genre ID
+        session: Optional client session
+        page: Result page, 20 movies each, most popular first
+
+    Returns:
+        List of movie dictionaries
+    """
+    return await run_flow(api_core.movies_by_genre_flow(genre_id, page), session)
+
+
+@negative_cached(empty_result, key_func=lambda tmdb_id, session=None: tmdb_id)
+async def fetch_recommendations(tmdb_id: int, session: Optional[aiohttp.ClientSession] = None) -> List[Dict]:
+    """
+    Gets similar movie recommendations from TMDB API.
+
+    Args:
+        tmdb_id: TMDB movie ID
+        session: Optional client session
+
+    Returns:
+        List of recommendation movie dictionaries
+    """
+    return await run_flow(api_core.recommendations_flow(tmdb_id), session)
+
+
+@negative_cached(empty_result, key_func=lambda imdb_id, session=None: imdb_id)
+async def fetch_streaming_info(imdb_id: str, session: Optional[aiohttp.ClientSession] = None) -> List[Dict]:
+    """
+    Gets streaming availability information from Watchmode API.
+
+    Args:
+        imdb_id: IMDb ID of the movie
+        session: Optional client session
+
+    Returns:
+        List of streaming source dictionaries
+    """
+    return await run_flow(api_core.streaming_info_flow(imdb_id), session)
+
+
+@negative_cached(no_result, key_func=lambda title, year, session=None, tmdb_id=None: (title, year))
+async def fetch_youtube_trailer(title: str, year: str, session: Optional[aiohttp.ClientSession] = None,
+                                tmdb_id: Optional[int] = None) -> Optional[str]:
+    """
+    Finds the official movie trailer, from TMDB videos before YouTube search.
+
+    Args:
+        title: Movie title
+        year: Movie year
+        session: Optional client session
+        tmdb_id: Optional TMDB ID, enabling the TMDB videos lookup
+
+    Returns:
+        YouTube trailer URL or None
+    """
+    started = time.perf_counter()
+    trailer_url, source = await run_flow(api_core.trailer_flow(title, year, tmdb_id), session)
+    record_resolution(source, time.perf_counter() - started)
+    return trailer_url
@@ -0,0 +1,148 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          CACHE HIT MICROBENCHMARK
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+# Compares the cost of a cache *hit* for the in-memory tiers in front of the
+# api_handlers fetchers: st.cache_data (unpickles a fresh copy per hit) and
+# shared_cache (returns one frozen object). No network: each cached function
+# returns a canned payload shaped like the real one.
+#
+#     python benchmarks/cache_hits.py [--hits N]
+
+import argparse
+import copy
+import gc
+import os
+import pickle
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shared_cache import shared_cache  # noqa: E402
+
+
+def movie_payload() -> Dict:
+    """A merged OMDB+TMDB dict of realistic width and nesting."""
+    return {
+        'Title': 'Inception', 'Year': '2010', 'Rated': 'PG-13', 'Released': '16 Jul 2010',
+        'Runtime': '148 min', 'Genre': 'Action, Adventure, Sci-Fi', 'Director': 'Christopher Nolan',
+        'Writer': 'Christopher Nolan', 'Actors': 'Leonardo DiCaprio, Joseph Gordon-Levitt, Elliot Page',
+        'Plot': 'A thief who steals corporate secrets through the use of dream-sharing technology ' * 6,
+        'Language': 'English, Japanese, French', 'Country': 'United States, United Kingdom',
+        'Awards': 'Won 4 Oscars. 159 wins & 220 nominations total',
+        'Poster': 'https://m.media-amazon.com/images/M/MV5BMjAxMzY3NjcxNF5BMl5BanBnXkFtZTcwNTI5OTM0Mw@@._V1_SX300.jpg',
+        'Ratings': [{'Source': source, 'Value': value} for source, value in
+                    (('Internet Movie Database', '8.8/10'), ('Rotten Tomatoes', '87%'), ('Metacritic', '74/100'))],
+        'Metascore': '74', 'imdbRating': '8.8', 'imdbVotes': '2,500,000', 'imdbID': 'tt1375666',
+        'Type': 'movie', 'BoxOffice': '$292,587,330', 'Response': 'True',
+        'adult': False, 'backdrop_path': '/s3TBrRGB1iav7gFOCNx3H31MoES.jpg', 'budget': 160000000,
+        'genres': [{'id': 28, 'name': 'Action'}, {'id': 878, 'name': 'Science Fiction'}, {'id': 12, 'name': 'Adventure'}],
+        'homepage': 'https://www.warnerbros.com/movies/inception', 'id': 27205, 'imdb_id': 'tt1375666',
+        'original_language': 'en', 'original_title': 'Inception', 'overview': 'Cobb, a skilled thief... ' * 8,
+        'popularity': 83.952, 'poster_path': '/oYuLEt3zVCKq57qu2F8dT7NIa6f.jpg',
+        'production_companies': [
+            {'id': company_id, 'logo_path': f'/logo{company_id}.png', 'name': name, 'origin_country': 'US'}
+            for company_id, name in ((923, 'Legendary Pictures'), (9996, 'Syncopy'), (174, 'Warner Bros. Pictures'))
+        ],
+        'production_countries': [{'iso_3166_1': 'GB', 'name': 'United Kingdom'},
+                                 {'iso_3166_1': 'US', 'name': 'United States of America'}],
+        'release_date': '2010-07-15', 'revenue': 825532764,
+        'spoken_languages': [{'english_name': name, 'iso_639_1': code, 'name': name}
+                             for code, name in (('en', 'English'), ('fr', 'French'), ('ja', 'Japanese'), ('sw', 'Swahili'))],
+        'status': 'Released', 'tagline': 'Your mind is the scene of the crime.', 'video': False,
+        'vote_average': 8.369, 'vote_count': 35000, 'tmdb_id': 27205,
+    }
+
+
+def recommendations_payload() -> List[Dict]:
+    """A page of 20 TMDB recommendation dicts."""
+    return [{
+        'adult': False, 'backdrop_path': f'/backdrop{i}.jpg', 'id': 1000 + i, 'title': f'Recommended Movie {i}',
+        'original_language': 'en', 'original_title': f'Recommended Movie {i}',
+        'overview': 'A plot summary of moderate length for a recommended movie. ' * 3,
+        'poster_path': f'/poster{i}.jpg', 'media_type': 'movie', 'genre_ids': [28, 878, 12],
+        'popularity': 50.0 + i, 'release_date': '2014-11-05', 'video': False, 'vote_average': 7.5, 'vote_count': 9000,
+    } for i in range(20)]
+
+
+def cache_data_decorator() -> Tuple[str, Callable]:
+    """st.cache_data when Streamlit is installed, else its hit path alone (pickle.loads)."""
+    try:
+        import streamlit as st
+        return 'st.cache_data', st.cache_data
+    except ImportError:
+        pass
+
+    def pickle_round_trip(fn: Callable) -> Callable:
+        stored = {}
+
+        def wrapper(*args):
+            if args not in stored:
+                stored[args] = pickle.dumps(fn(*args), protocol=pickle.HIGHEST_PROTOCOL)
+            return pickle.loads(stored[args])
+        return wrapper
+
+    return 'pickle.loads (st.cache_data hit path; Streamlit not installed)', pickle_round_trip
+
+
+def measure(fetch: Callable, hits: int) -> Tuple[float, float, int]:
+    """
+    Times `hits` warm calls and traces the allocations of one.
+
+    Returns:
+        Tuple of (mean µs per hit, p99 µs per hit, bytes allocated per hit)
+    """
+    fetch()  # Warm the cache
+    gc.collect()
+    gc.disable()
+    try:
+        samples = []
+        for _ in range(hits):
+            started = time.perf_counter_ns()
+            fetch()
+            samples.append(time.perf_counter_ns() - started)
+    finally:
+        gc.enable()
+    samples.sort()
+
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = fetch()
+        _, peak = tracemalloc.get_traced_memory()
+        del result
+    finally:
+        tracemalloc.stop()
+
+    return sum(samples) / len(samples) / 1000, samples[int(len(samples) * 0.99)] / 1000, peak - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare cache hit latency and allocations.")
+    parser.add_argument('--hits', type=int, default=20000, help='warm calls timed per case')
+    options = parser.parse_args()
+
+    baseline_name, baseline = cache_data_decorator()
+    payloads = {'movie record (dict)': movie_payload, 'recommendations (20)': recommendations_payload}
+
+    print(f"{'payload':<22} {'tier':<16} {'mean µs':>9} {'p99 µs':>9} {'bytes/hit':>10}  same object")
+    for payload_name, build in payloads.items():
+        payload = build()
+        for tier_name, decorator in (('baseline', baseline), ('shared_cache', shared_cache())):
+            def load(key: str, payload=payload) -> object:
+                return copy.deepcopy(payload)
+
+            fetch = decorator(load)
+            mean_us, p99_us, allocated = measure(lambda: fetch(payload_name), options.hits)
+            shared = fetch(payload_name) is fetch(payload_name)
+            print(f"{payload_name:<22} {tier_name:<16} {mean_us:>9.2f} {p99_us:>9.2f} {allocated:>10}  {shared}")
+
+    print(f"\nbaseline = {baseline_name}")
+
+
+if __name__ == '__main__':
+    main()
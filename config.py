@@ -3,6 +3,7 @@
 #                              CONFIGURATION MODULE
 # ═══════════════════════════════════════════════════════════════════════════════
 
+import os
 from datetime import datetime
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -29,11 +30,109 @@ WATCHMODE_BASE_URL = "https://api.watchmode.com/v1/"
 # Application Settings
 # ──────────────────────────────────────────────────────────────────────────────
 
-MAX_HISTORY = 10
-MAX_FAVORITES = 20
+MAX_HISTORY = 500             # per user, kept in the user store
+MAX_FAVORITES = 10000
 CACHE_TTL = 3600              # 1 hour
 TRENDING_CACHE_TTL = 300      # 5 minutes
 
+# ──────────────────────────────────────────────────────────────────────────────
+# HTTP Client Settings
+# ──────────────────────────────────────────────────────────────────────────────
+
+HTTP_POOL_CONNECTIONS = 4     # host pools kept per service session
+
+HTTP_POOL_MAXSIZE = {         # keep-alive connections per host
+    "omdb": 10,
+    "tmdb": 20,
+    "watchmode": 5,
+    "youtube": 5,
+    "posters": 10,
+    "default": 10
+}
+
+HTTP_TIMEOUTS = {             # seconds, per endpoint
+    "omdb": 15,
+    "tmdb.find": 15,
+    "tmdb.details": 15,
+    "tmdb.search": 5,
+    "tmdb.trending": 10,
+    "tmdb.discover": 10,
+    "tmdb.recommendations": 10,
+    "tmdb.videos": 5,
+    "watchmode": 10,
+    "youtube": 10,
+    "posters": 10,
+    "default": 10
+}
+
+ENRICHMENT_MAX_WORKERS = 8    # shared pool for concurrent upstream lookups
+ASYNC_HTTP_LIMIT = 100        # total connections for async_api_handlers
+ASYNC_HTTP_LIMIT_PER_HOST = 30
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Persistent Cache Settings
+# ──────────────────────────────────────────────────────────────────────────────
+
+PERSISTENT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "responses.sqlite3")
+PERSISTENT_CACHE_MAX_ENTRIES = 5000
+STALE_HARD_TTL = 6 * 3600     # never serve stale entries older than this
+STALE_REFRESH_WORKERS = 2
+STALE_FRONT_TTL = 60          # in-memory TTL in front of stale-while-revalidate tiers
+ZERO_COPY_CACHE = True        # share frozen results across sessions; callers treat results as read-only
+SHARED_CACHE_MAX_ENTRIES = 1000   # per fetcher, when ZERO_COPY_CACHE is on
+
+USER_STORE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "users.sqlite3")
+USER_LIST_PAGE_SIZE = 20      # history/favorites rows per sidebar page
+RECORD_STORE_MAX_ENTRIES = 2000      # shared movie records kept in memory
+RECORD_INTERN_MAX_LENGTH = 64        # longer strings (plots, overviews) are not interned
+
+NEGATIVE_CACHE_TTL_NOT_FOUND = 900    # 15 minutes for titles the upstream does not know
+NEGATIVE_CACHE_TTL_TRANSIENT = 30     # timeouts and network errors
+NEGATIVE_CACHE_MAX_ENTRIES = 10000
+
+SUGGESTION_INDEX_MAX_TITLES = 20000   # titles kept in the local autocomplete index
+SUGGESTION_DEBOUNCE_SECONDS = 0.3     # quiet time after a keystroke before fetching
+SUGGESTION_POLL_INTERVAL = 0.3        # how often the suggestion fragment checks for results
+SUGGESTION_WORKERS = 4
+
+POSTER_RENDITION_WIDTH = 92           # smallest TMDB/Amazon poster rendition to analyze
+POSTER_SAMPLE_SIZE = 64               # longest side of the pixel buffer after decoding
+DEFAULT_POSTER_COLOR = (10, 10, 20)
+POSTER_PALETTE_SIZE = 5               # dominant colors returned per poster
+POSTER_KMEANS_ITERATIONS = 10
+POSTER_PALETTE_BUDGET_SECONDS = 0.05  # decode + clustering budget per poster
+
+TRAILER_CACHE_TTL = 30 * 86400        # resolved trailers, keyed by imdbID
+TRAILER_MISS_TTL = 86400              # titles with no trailer found
+TRAILER_COLD_BUDGET_MS = 1500         # upstream resolution
+TRAILER_WARM_BUDGET_MS = 5            # persistent cache hit
+YOUTUBE_SEARCH_QUOTA_COST = 100       # quota units per search.list call
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Genres
+# ──────────────────────────────────────────────────────────────────────────────
+
+GENRES = {                    # display name -> TMDB genre ID
+    'All': None,
+    'Action': 28,
+    'Comedy': 35,
+    'Drama': 18,
+    'Horror': 27,
+    'Sci-Fi': 878,
+    'Romance': 10749,
+    'Thriller': 53,
+    'Animation': 16,
+    'Documentary': 99,
+    'Fantasy': 14
+}
+
+GENRE_WARM_PAGES = 3          # discover pages kept warm per genre
+GENRE_CACHE_TTL = 6 * 3600
+GENRE_WARM_INTERVAL = 3 * 3600
+GENRE_WARM_WORKERS = 2        # own pool, so warming never queues detail-page lookups
+DISCOVER_MAX_PAGES = 5        # page cap for filtered discover queries
+DISCOVER_MIN_YEAR = 1900      # year slider floor; a bound at the floor is no filter
+
 # ──────────────────────────────────────────────────────────────────────────────
 # UI Configuration
 # ──────────────────────────────────────────────────────────────────────────────
@@ -73,8 +172,6 @@ FONTS = {
 
 SESSION_STATE_DEFAULTS = {
     "search_query": "",
-    "search_history": [],
-    "favorites": [],
     "current_movie": None,
     "should_search": False,
     "selected_genre": "All",
@@ -0,0 +1,93 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          DETAIL LOADER MODULE
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+# Starts every secondary lookup of a detail page (trailer, streaming,
+# recommendations) at once, as soon as fetch_movie_data has produced the
+# IDs they need. Each tab then waits only on its own future, so the page
+# takes about as long as the slowest call rather than the sum of them.
+
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional
+from enrichment import record_timing, submit
+
+
+class DetailBundle:
+    """Futures for one movie's secondary data, keyed by name."""
+
+    def __init__(self, futures: Dict[str, Future]):
+        self.futures = futures
+        self._started = time.perf_counter()
+        self._remaining = len(futures)
+        self._lock = threading.Lock()
+        for future in futures.values():
+            future.add_done_callback(self._on_done)
+
+    def _on_done(self, future: Future):
+        with self._lock:
+            self._remaining -= 1
+            finished = self._remaining == 0
+        if finished:
+            record_timing('detail.secondary', time.perf_counter() - self._started)
+
+    def result(self, name: str, default: Any = None, timeout: Optional[float] = None) -> Any:
+        """
+        Waits for one secondary lookup.
+
+        Args:
+            name: Lookup name given to load_details
+            default: Returned when the lookup was not scheduled or failed
+            timeout: Seconds to wait; None waits for completion
+
+        Returns:
+            The fetcher's result, or `default`
+        """
+        future = self.futures.get(name)
+        if future is None:
+            return default
+        try:
+            return future.result(timeout)
+        except Exception:
+            return default
+
+    def done(self, name: str) -> bool:
+        """True when the named lookup has finished (or was never scheduled)."""
+        future = self.futures.get(name)
+        return future is None or future.done()
+
+
+def load_details(fetchers: Dict[str, Optional[Callable[[], Any]]]) -> DetailBundle:
+    """
+    Submits all secondary fetchers to the shared executor concurrently.
+
+    Args:
+        fetchers: Dict of name to zero-argument fetcher; None entries (e.g.
+            no tmdb_id for recommendations) are skipped
+
+    Returns:
+        DetailBundle holding one future per scheduled fetcher
+    """
+    return DetailBundle({name: submit(fetch) for name, fetch in fetchers.items() if fetch is not None})
+
+
+def movie_detail_fetchers(movie_data: Dict) -> Dict[str, Optional[Callable[[], Any]]]:
+    """
+    Builds the standard trailer/streaming/recommendations fetchers.
+
+    Args:
+        movie_data: Result of api_handlers.fetch_movie_data
+
+    Returns:
+        Fetchers for load_details, bound to this movie's IDs
+    """
+    from api_handlers import fetch_recommendations, fetch_streaming_info, fetch_youtube_trailer
+
+    title, year = movie_data.get('Title', ''), movie_data.get('Year', '')
+    imdb_id, tmdb_id = movie_data.get('imdbID'), movie_data.get('tmdb_id')
+    return {
+        'trailer': lambda: fetch_youtube_trailer(title, year, imdb_id, tmdb_id),
+        'streaming': (lambda: fetch_streaming_info(imdb_id)) if imdb_id else None,
+        'recommendations': (lambda: fetch_recommendations(tmdb_id)) if tmdb_id else None,
+    }
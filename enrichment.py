@@ -0,0 +1,89 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          ENRICHMENT PIPELINE MODULE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict
+from config import ENRICHMENT_MAX_WORKERS
+
+
+_executor = ThreadPoolExecutor(
+    max_workers=ENRICHMENT_MAX_WORKERS,
+    thread_name_prefix="enrichment"
+)
+
+_timings: Dict[str, Dict[str, float]] = {}
+_timings_lock = threading.Lock()
+
+
+def record_timing(stage: str, elapsed: float):
+    """Adds one stage duration to the aggregated timings."""
+    with _timings_lock:
+        entry = _timings.setdefault(stage, {'calls': 0, 'total': 0.0, 'max': 0.0, 'last': 0.0})
+        entry['calls'] += 1
+        entry['total'] += elapsed
+        entry['max'] = max(entry['max'], elapsed)
+        entry['last'] = elapsed
+
+
+def run_stage(stage: str, fn: Callable, *args, **kwargs) -> Any:
+    """
+    Runs a stage in the calling thread and records its duration.
+
+    Args:
+        stage: Stage name used in the timing report
+        fn: Callable doing the stage's work
+
+    Returns:
+        Whatever `fn` returns; exceptions propagate after timing is recorded
+    """
+    started = time.perf_counter()
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        record_timing(stage, time.perf_counter() - started)
+
+
+def submit_stage(stage: str, fn: Callable, *args, **kwargs) -> Future:
+    """
+    Schedules a stage on the shared bounded executor.
+
+    Args:
+        stage: Stage name used in the timing report
+        fn: Callable doing the stage's work
+
+    Returns:
+        Future resolving to the stage's result
+    """
+    return _executor.submit(run_stage, stage, fn, *args, **kwargs)
+
+
+def submit(fn: Callable, *args, **kwargs) -> Future:
+    """Schedules untimed work on the shared bounded executor."""
+    return _executor.submit(fn, *args, **kwargs)
+
+
+def in_worker_thread() -> bool:
+    """True when called from one of the shared executor's threads."""
+    return threading.current_thread().name.startswith("enrichment")
+
+
+def get_stage_timings() -> Dict[str, Dict[str, float]]:
+    """
+    Reports per-stage timings in milliseconds.
+
+    Returns:
+        Dict of stage name to call count and average, max and last duration
+    """
+    with _timings_lock:
+        return {
+            stage: {
+                'calls': int(entry['calls']),
+                'avg_ms': round(entry['total'] * 1000 / entry['calls'], 2),
+                'max_ms': round(entry['max'] * 1000, 2),
+                'last_ms': round(entry['last'] * 1000, 2),
+            }
+            for stage, entry in _timings.items()
+        }
@@ -0,0 +1,75 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          GENRE WARMER MODULE
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+# Keeps TMDB /discover results for every genre in config.GENRES warm: the
+# first GENRE_WARM_PAGES pages of each genre are fetched on startup and
+# every GENRE_WARM_INTERVAL seconds, and seeded into fetch_movies_by_genre's
+# persistent entries, so genre pages render without a cold TMDB call.
+# Warming runs on its own small pool, never on the enrichment executor
+# that serves detail pages.
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+import api_core
+from api_core import UpstreamError
+from api_handlers import fetch_movies_by_genre, run_flow
+from config import GENRE_WARM_INTERVAL, GENRE_WARM_PAGES, GENRE_WARM_WORKERS, GENRES
+from enrichment import run_stage
+from scheduler import schedule
+from suggestion_index import suggestion_index
+
+_executor = ThreadPoolExecutor(max_workers=GENRE_WARM_WORKERS, thread_name_prefix="genre-warm")
+
+_stats = {'pages_warmed': 0, 'pages_failed': 0}
+_stats_lock = threading.Lock()
+
+
+def _warm_page(genre_id: int, page: int) -> bool:
+    try:
+        movies = run_flow(api_core.movies_by_genre_flow(genre_id, page))
+    except UpstreamError:
+        return False
+    # Positional arguments, matching how pages are requested (see get_genre_page)
+    fetch_movies_by_genre.seed(movies, genre_id, page)
+    suggestion_index.add(api_core.parse_suggestions({'results': movies}, limit=None))
+    return True
+
+
+def warm_genres():
+    """Fetches and seeds every genre page on the warmer's pool (scheduler job)."""
+    futures = [
+        _executor.submit(run_stage, 'genre_warm', _warm_page, genre_id, page)
+        for genre_id in GENRES.values() if genre_id is not None
+        for page in range(1, GENRE_WARM_PAGES + 1)
+    ]
+    warmed = sum(1 for future in futures if future.result())
+    with _stats_lock:
+        _stats['pages_warmed'] += warmed
+        _stats['pages_failed'] += len(futures) - warmed
+
+
+def start_genre_warmer():
+    """Starts the warmer once per process; safe to call on every rerun."""
+    schedule('genre_warmer', GENRE_WARM_INTERVAL, warm_genres)
+
+
+def get_genre_page(genre_id: int, page: int = 1) -> List[Dict]:
+    """
+    Returns one page of a genre, normally from the warm cache.
+
+    Args:
+        genre_id: TMDB genre ID
+        page: Result page, 1-based
+
+    Returns:
+        List of TMDB movie dictionaries
+    """
+    return fetch_movies_by_genre(genre_id, page)
+
+
+def get_genre_warmer_stats() -> Dict[str, int]:
+    """Returns how many genre pages have been warmed or failed so far."""
+    with _stats_lock:
+        return dict(_stats)
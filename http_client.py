@@ -0,0 +1,162 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          HTTP CLIENT MODULE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from typing import Dict, Optional
+from config import HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, HTTP_TIMEOUTS
+
+
+class PoolStats:
+    """Thread-safe counters for one service's connection pools."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.new_connections = 0
+        self.in_use = 0
+        self.wait_seconds = 0.0
+
+    def record_checkout(self, waited: float):
+        with self._lock:
+            self.requests += 1
+            self.in_use += 1
+            self.wait_seconds += waited
+
+    def record_checkin(self):
+        with self._lock:
+            self.in_use = max(0, self.in_use - 1)
+
+    def record_new_connection(self):
+        with self._lock:
+            self.new_connections += 1
+
+
+def _instrumented_pool(base: type, stats: PoolStats) -> type:
+    """Builds a urllib3 pool class that reports checkouts to `stats`."""
+
+    class InstrumentedPool(base):
+        def _get_conn(self, timeout=None):
+            started = time.perf_counter()
+            conn = super()._get_conn(timeout)
+            stats.record_checkout(time.perf_counter() - started)
+            return conn
+
+        def _put_conn(self, conn):
+            stats.record_checkin()
+            return super()._put_conn(conn)
+
+        def _new_conn(self):
+            stats.record_new_connection()
+            return super()._new_conn()
+
+    return InstrumentedPool
+
+
+class PooledAdapter(HTTPAdapter):
+    """HTTPAdapter whose keep-alive pools are instrumented with PoolStats."""
+
+    def __init__(self, stats: PoolStats, **kwargs):
+        self.stats = stats
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _instrumented_pool(HTTPConnectionPool, self.stats),
+            'https': _instrumented_pool(HTTPSConnectionPool, self.stats),
+        }
+
+
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def _service_for(endpoint: str) -> str:
+    """Maps an endpoint name such as 'tmdb.search' to its service ('tmdb')."""
+    return endpoint.split('.', 1)[0]
+
+
+def get_session(service: str) -> requests.Session:
+    """
+    Returns the process-wide session for a service, creating it on first use.
+
+    Args:
+        service: Service name ('omdb', 'tmdb', 'watchmode', 'youtube')
+
+    Returns:
+        Shared requests.Session with a keep-alive connection pool
+    """
+    session = _sessions.get(service)
+    if session is not None:
+        return session
+
+    with _sessions_lock:
+        session = _sessions.get(service)
+        if session is None:
+            maxsize = HTTP_POOL_MAXSIZE.get(service, HTTP_POOL_MAXSIZE['default'])
+            adapter = PooledAdapter(
+                PoolStats(),
+                pool_connections=HTTP_POOL_CONNECTIONS,
+                pool_maxsize=maxsize
+            )
+            session = requests.Session()
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _sessions[service] = session
+    return session
+
+
+def get(endpoint: str, url: str, params: Optional[Dict] = None) -> requests.Response:
+    """
+    Issues a GET through the shared pool for the endpoint's service.
+
+    Args:
+        endpoint: Endpoint name used to pick the pool and timeout (e.g. 'tmdb.search')
+        url: Request URL
+        params: Optional query parameters
+
+    Returns:
+        The requests.Response; network errors propagate as requests exceptions
+    """
+    timeout = HTTP_TIMEOUTS.get(endpoint, HTTP_TIMEOUTS['default'])
+    return get_session(_service_for(endpoint)).get(url, params=params, timeout=timeout)
+
+
+def get_pool_stats() -> Dict[str, Dict]:
+    """
+    Summarizes connection pool usage per service.
+
+    Returns:
+        Dict of service name to reuse ratio, open sockets and wait times
+    """
+    summary = {}
+    for service, session in list(_sessions.items()):
+        adapter = session.get_adapter('https://')
+        stats = adapter.stats
+        idle_sockets = 0
+        pools = adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None or pool.pool is None:
+                continue
+            idle_sockets += sum(
+                1 for conn in list(pool.pool.queue)
+                if conn is not None and getattr(conn, 'sock', None) is not None
+            )
+
+        reused = stats.requests - stats.new_connections
+        summary[service] = {
+            'requests': stats.requests,
+            'new_connections': stats.new_connections,
+            'reuse_ratio': round(reused / stats.requests, 3) if stats.requests else 0.0,
+            'open_sockets': idle_sockets + stats.in_use,
+            'in_use': stats.in_use,
+            'total_wait_ms': round(stats.wait_seconds * 1000, 2),
+            'avg_wait_ms': round(stats.wait_seconds * 1000 / stats.requests, 3) if stats.requests else 0.0,
+        }
+    return summary
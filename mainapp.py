@@ -5,8 +5,13 @@
 
 import streamlit as st
 from datetime import datetime
-from config import APP_TITLE, APP_SUBTITLE, APP_ICON, COLORS, FONTS, SESSION_STATE_DEFAULTS
-from api_handlers import fetch_movie_data, fetch_search_suggestions, fetch_youtube_trailer
+from config import (
+    APP_TITLE, APP_SUBTITLE, APP_ICON, COLORS, FONTS, SESSION_STATE_DEFAULTS, SUGGESTION_POLL_INTERVAL
+)
+from api_handlers import fetch_movie_data, fetch_search_suggestions
+from suggestion_index import suggestion_index
+from suggestion_pipeline import get_pipeline
+from detail_loader import load_details, movie_detail_fetchers
 
 # ──────────────────────────────────────────────────────────────────────────────
 # PAGE CONFIG
@@ -103,26 +108,35 @@ query = st.text_input(
 # SEARCH SUGGESTIONS
 # ──────────────────────────────────────────────────────────────────────────────
 
-suggestions = fetch_search_suggestions(query) if query and len(query) >= 2 else []
-
-if suggestions:
-    st.markdown("### 🔮 Suggestions")
-    for movie in suggestions:
-        col1, col2 = st.columns([1, 6])
-        with col1:
-            if movie.get("poster"):
-                st.image(movie["poster"], width=70)
-        with col2:
-            if movie.get("title") and st.button(
-                f"{movie['title']} ({movie.get('year', 'N/A')}) ⭐ {movie.get('rating', 0)}",
-                key=f"suggest_{movie['id']}"
-            ):
-                try:
-                    st.session_state.search_query = movie["title"]
-                    st.session_state.should_search = True
-                    st.experimental_rerun()
-                except Exception as e:
-                    st.error(f"Error selecting movie: {e}")
+# Polls on a timer so results land without a full rerun or a blocking wait
+@st.fragment(run_every=SUGGESTION_POLL_INTERVAL)
+def show_suggestions():
+    pipeline = get_pipeline(st.session_state)
+    suggestions = pipeline.results()
+
+    if suggestions:
+        st.markdown("### 🔮 Suggestions")
+        for movie in suggestions:
+            col1, col2 = st.columns([1, 6])
+            with col1:
+                if movie.get("poster"):
+                    st.image(movie["poster"], width=70)
+            with col2:
+                if movie.get("title") and st.button(
+                    f"{movie['title']} ({movie.get('year', 'N/A')}) ⭐ {movie.get('rating', 0)}",
+                    key=f"suggest_{movie['id']}"
+                ):
+                    try:
+                        st.session_state.search_query = movie["title"]
+                        st.session_state.should_search = True
+                        st.rerun()
+                    except Exception as e:
+                        st.error(f"Error selecting movie: {e}")
+
+
+get_pipeline(st.session_state).submit(query or "", fetch_search_suggestions, local=suggestion_index.search,
+                                      provisional=suggestion_index.provisional)
+show_suggestions()
 
 # ──────────────────────────────────────────────────────────────────────────────
 # SEARCH BUTTON
@@ -143,6 +157,9 @@ if st.session_state.should_search and st.session_state.search_query:
     if error:
         st.error(error)
     elif movie_data:
+        # Trailer lookup runs while the poster and details render
+        details = load_details({'trailer': movie_detail_fetchers(movie_data)['trailer']})
+
         st.divider()
         st.markdown(
             f"<h2 style='text-align:center;'>{movie_data.get('Title')} ({movie_data.get('Year')})</h2>",
@@ -171,10 +188,7 @@ if st.session_state.should_search and st.session_state.search_query:
 
         # ───── TRAILER & LINK
         
-        trailer_url = fetch_youtube_trailer(
-            movie_data.get("Title"),
-            movie_data.get("Year", "")
-        )
+        trailer_url = details.result('trailer')
         if trailer_url:
             st.divider()
             st.markdown("### ▶️ Official Trailer")
@@ -0,0 +1,130 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          MOVIE COLLECTIONS MODULE
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+# Bounded, newest-first collections for the per-session search history and
+# favorites. Entries are keyed by imdbID, with the canonical title as a
+# secondary key, so membership checks on every detail render and removals
+# from the sidebar are dict lookups instead of scans over the whole list.
+
+import time
+from collections import OrderedDict
+from itertools import islice
+from typing import Dict, Iterator, List, Optional
+from title_index import canonicalize_title
+
+
+class MovieEntry:
+    """One remembered movie; slotted, since a session may hold thousands."""
+
+    __slots__ = ('imdb_id', 'title', 'year', 'poster', 'rating', 'timestamp')
+
+    def __init__(self, imdb_id: str, title: str, year: str = 'N/A', poster: str = '',
+                 rating: str = 'N/A', timestamp: Optional[float] = None):
+        self.imdb_id = imdb_id
+        self.title = title
+        self.year = year
+        self.poster = poster
+        self.rating = rating
+        self.timestamp = time.time() if timestamp is None else timestamp
+
+    @classmethod
+    def from_movie(cls, movie_title: str, movie_data: Dict) -> 'MovieEntry':
+        """Builds an entry from an OMDB/TMDB movie dict."""
+        return cls(
+            imdb_id=movie_data.get('imdbID') or '',
+            title=movie_title,
+            year=movie_data.get('Year', 'N/A'),
+            poster=movie_data.get('Poster', ''),
+            rating=movie_data.get('imdbRating', 'N/A')
+        )
+
+    @property
+    def key(self) -> str:
+        """Primary key: the imdbID, or the canonical title when there is none."""
+        return self.imdb_id or f"title:{canonicalize_title(self.title)}"
+
+    def __repr__(self) -> str:
+        return f"MovieEntry({self.key!r}, {self.title!r})"
+
+
+class MovieCollection:
+    """
+    Ordered, capacity-bounded set of MovieEntry, newest first.
+
+    Lookups accept either an imdbID or a title; titles are matched on their
+    canonical form, so "Inception" and "inception " find the same entry.
+    When the collection is full, adding evicts the oldest entry.
+    """
+
+    __slots__ = ('capacity', '_entries', '_by_title')
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._entries: "OrderedDict[str, MovieEntry]" = OrderedDict()
+        self._by_title: Dict[str, str] = {}
+
+    def _primary_key(self, key_or_title: str) -> Optional[str]:
+        if key_or_title in self._entries:
+            return key_or_title
+        return self._by_title.get(canonicalize_title(key_or_title))
+
+    def find(self, key_or_title: str) -> Optional[MovieEntry]:
+        """Returns the entry for an imdbID or title, if present."""
+        key = self._primary_key(key_or_title or '')
+        return self._entries.get(key) if key is not None else None
+
+    def __contains__(self, key_or_title: str) -> bool:
+        return self._primary_key(key_or_title or '') is not None
+
+    def add(self, entry: MovieEntry) -> bool:
+        """
+        Puts an entry at the front, replacing any entry with the same key.
+
+        Args:
+            entry: Entry to add
+
+        Returns:
+            True if the movie was not in the collection before
+        """
+        key = entry.key
+        is_new = key not in self._entries
+        self._entries[key] = entry
+        self._entries.move_to_end(key, last=False)
+        self._by_title[canonicalize_title(entry.title)] = key
+
+        while len(self._entries) > self.capacity:
+            _, evicted = self._entries.popitem(last=True)
+            self._forget_title(evicted)
+        return is_new
+
+    def remove(self, key_or_title: str) -> bool:
+        """Removes the entry for an imdbID or title; returns whether one existed."""
+        key = self._primary_key(key_or_title or '')
+        if key is None:
+            return False
+        self._forget_title(self._entries.pop(key))
+        return True
+
+    def _forget_title(self, entry: MovieEntry):
+        title_key = canonicalize_title(entry.title)
+        if self._by_title.get(title_key) == entry.key:
+            del self._by_title[title_key]
+
+    def clear(self):
+        """Removes every entry."""
+        self._entries.clear()
+        self._by_title.clear()
+
+    def page(self, offset: int, limit: int) -> List[MovieEntry]:
+        """Returns up to `limit` entries, newest first, skipping `offset`."""
+        return list(islice(self._entries.values(), offset, offset + limit))
+
+    def __iter__(self) -> Iterator[MovieEntry]:
+        return iter(list(self._entries.values()))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"MovieCollection({len(self)}/{self.capacity})"
@@ -0,0 +1,100 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          MOVIE RECORD MODULE
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+# Compact, immutable form of a merged OMDB+TMDB movie: only the fields the
+# UI reads, in slots. The full payload (production companies, spoken
+# languages, every other TMDB field) stays in the persistent cache under
+# the imdbID and is loaded only when `raw` is asked for.
+
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator
+from response_cache import get_cache
+
+MOVIE_RECORDS_NAMESPACE = 'movie_records'
+MOVIE_PAYLOAD_TTL = 3600
+
+FIELDS = (
+    'Title', 'Year', 'Poster', 'imdbRating', 'Metascore', 'Runtime', 'Genre', 'Director',
+    'Writer', 'Country', 'Actors', 'Plot', 'tagline', 'tmdb_id', 'imdbID', 'poster_path'
+)
+
+
+class MovieRecord(Mapping):
+    """
+    Read-only movie record with dict-style access to the UI fields.
+
+    `record['Title']` and `record.get('Metascore', 'N/A')` behave as on the
+    merged dict, with fields the payload lacked treated as missing keys.
+    Any other key is missing too; use `raw` for the full payload.
+    """
+
+    __slots__ = FIELDS
+
+    def __init__(self, **fields: Any):
+        for name in FIELDS:
+            object.__setattr__(self, name, fields.get(name))
+
+    @classmethod
+    def from_payload(cls, movie_data: Dict) -> 'MovieRecord':
+        """Keeps the UI fields of a merged movie dict."""
+        return cls(**{name: movie_data[name] for name in FIELDS if name in movie_data})
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError("MovieRecord is read-only")
+
+    def __reduce__(self):
+        return (_rebuild, (tuple(getattr(self, name) for name in FIELDS),))
+
+    def __getitem__(self, key: str) -> Any:
+        value = getattr(self, key, None) if key in FIELDS else None
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return (name for name in FIELDS if getattr(self, name) is not None)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, MovieRecord):
+            return all(getattr(self, name) == getattr(other, name) for name in FIELDS)
+        return Mapping.__eq__(self, other)
+
+    __hash__ = None
+
+    @property
+    def raw(self) -> Dict:
+        """
+        Loads the full merged payload from the persistent cache.
+
+        Not kept on the record, so the shared copy stays compact. Falls
+        back to the UI fields once the payload has been evicted.
+        """
+        if self.imdbID:
+            try:
+                hit, movie_data = get_cache().get(MOVIE_RECORDS_NAMESPACE, self.imdbID)
+                if hit:
+                    return movie_data
+            except Exception:
+                pass
+        return dict(self)
+
+    def __repr__(self) -> str:
+        return f"MovieRecord({self.imdbID!r}, {self.Title!r})"
+
+
+def persist_payload(movie_data: Dict):
+    """Stores a full merged payload under its imdbID so `raw` can load it; best effort."""
+    if not movie_data.get('imdbID'):
+        return
+    try:
+        get_cache().set(MOVIE_RECORDS_NAMESPACE, movie_data['imdbID'], movie_data, MOVIE_PAYLOAD_TTL)
+    except Exception:
+        pass  # Persisting is best effort
+
+
+def _rebuild(values: tuple) -> MovieRecord:
+    return MovieRecord(**dict(zip(FIELDS, values)))
@@ -0,0 +1,134 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          NEGATIVE CACHE MODULE
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+# Remembers failed lookups for a short time, separately from real results.
+# A definitive miss (NotFound, e.g. a typo'd title) is remembered for
+# NEGATIVE_CACHE_TTL_NOT_FOUND; a transient failure (UpstreamError, e.g. a
+# timeout) only for NEGATIVE_CACHE_TTL_TRANSIENT, so one network blip does
+# not blank a section for the full result TTL.
+
+import asyncio
+import functools
+import threading
+import time
+from collections import Counter, OrderedDict, defaultdict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+from api_core import NotFound, UpstreamError
+from config import (
+    NEGATIVE_CACHE_MAX_ENTRIES, NEGATIVE_CACHE_TTL_NOT_FOUND, NEGATIVE_CACHE_TTL_TRANSIENT
+)
+from response_cache import make_key
+
+
+class NegativeCache:
+    """Bounded in-memory map of recent failures with per-kind TTLs."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, Hashable], Tuple[float, Exception]]" = OrderedDict()
+        self._stats: Dict[str, Counter] = defaultdict(Counter)
+
+    @staticmethod
+    def ttl_for(error: Exception) -> float:
+        """Picks the retention policy for a failure."""
+        if isinstance(error, NotFound):
+            return NEGATIVE_CACHE_TTL_NOT_FOUND
+        return NEGATIVE_CACHE_TTL_TRANSIENT
+
+    def lookup(self, namespace: str, key: Hashable) -> Optional[Exception]:
+        """Returns the remembered failure for a key, if still live."""
+        with self._lock:
+            entry = self._entries.get((namespace, key))
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[(namespace, key)]
+                return None
+            self._stats[namespace]['hits'] += 1
+            return entry[1]
+
+    def record(self, namespace: str, key: Hashable, error: Exception):
+        """Remembers a failure according to its policy."""
+        kind = 'not_found' if isinstance(error, NotFound) else 'transient'
+        with self._lock:
+            self._entries[(namespace, key)] = (time.monotonic() + self.ttl_for(error), error)
+            self._entries.move_to_end((namespace, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._stats[namespace][kind] += 1
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Reports counters per namespace.
+
+        Returns:
+            Dict of namespace to hits, not_found and transient counts
+        """
+        with self._lock:
+            return {namespace: dict(counts) for namespace, counts in self._stats.items()}
+
+
+_negative_cache = NegativeCache(NEGATIVE_CACHE_MAX_ENTRIES)
+
+
+def get_negative_cache_stats() -> Dict[str, Dict[str, int]]:
+    """Returns the process-wide negative cache counters."""
+    return _negative_cache.stats()
+
+
+def negative_cached(fallback: Callable[[Exception], Any], key_func: Optional[Callable[..., Hashable]] = None):
+    """
+    Decorator turning NotFound/UpstreamError into fallback values.
+
+    Place it above the in-memory tier (@st.cache_data or @shared_cache):
+    the cached function raises on failure (so the failure is never stored
+    as a result), and this layer remembers the failure for its short TTL
+    and returns `fallback(error)` instead.
+    Works on both plain and async functions.
+
+    Args:
+        fallback: Maps the failure to the fetcher's documented return value
+        key_func: Builds the key from the call arguments; defaults to the
+            arguments themselves
+
+    Returns:
+        Decorator for the fetcher
+    """
+    def decorator(fn: Callable) -> Callable:
+        namespace = getattr(fn, '__qualname__', getattr(fn, '__name__', repr(fn)))
+
+        def key_of(args, kwargs):
+            return key_func(*args, **kwargs) if key_func else make_key(args, kwargs)
+
+        if asyncio.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                key = key_of(args, kwargs)
+                remembered = _negative_cache.lookup(namespace, key)
+                if remembered is not None:
+                    return fallback(remembered)
+                try:
+                    return await fn(*args, **kwargs)
+                except (NotFound, UpstreamError) as error:
+                    _negative_cache.record(namespace, key, error)
+                    return fallback(error)
+
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = key_of(args, kwargs)
+            remembered = _negative_cache.lookup(namespace, key)
+            if remembered is not None:
+                return fallback(remembered)
+            try:
+                return fn(*args, **kwargs)
+            except (NotFound, UpstreamError) as error:
+                _negative_cache.record(namespace, key, error)
+                return fallback(error)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,231 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          POSTER PALETTE MODULE
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+# Poster colors for the dynamic background. Posters are fetched at the
+# smallest rendition the host offers, decoded straight to a small buffer
+# and reduced with vectorized NumPy math: a mean color, or a dominant
+# palette from k-means under a per-image time budget. Results are persisted
+# by poster URL, so each poster is analyzed once.
+
+import io
+import re
+import time
+import numpy as np
+import requests
+from PIL import Image
+from typing import Dict, Iterable, List, Tuple
+import http_client
+from api_core import NotFound, UpstreamError
+from config import (
+    DEFAULT_POSTER_COLOR, POSTER_KMEANS_ITERATIONS, POSTER_PALETTE_BUDGET_SECONDS,
+    POSTER_PALETTE_SIZE, POSTER_RENDITION_WIDTH, POSTER_SAMPLE_SIZE
+)
+from enrichment import in_worker_thread, submit_stage
+from negative_cache import negative_cached
+from response_cache import persistent_cache
+from singleflight import single_flight
+
+Color = Tuple[int, int, int]
+
+_TMDB_SIZE = re.compile(r"/t/p/[^/]+/")
+_AMAZON_SIZE = re.compile(r"\._V1_[^/]*\.(jpe?g|png)$", re.IGNORECASE)
+
+
+def small_rendition_url(poster_url: str) -> str:
+    """
+    Rewrites a TMDB or Amazon (OMDB) poster URL to its smallest rendition.
+
+    Args:
+        poster_url: Poster URL at any size
+
+    Returns:
+        URL of the POSTER_RENDITION_WIDTH rendition; unknown hosts unchanged
+    """
+    if 'image.tmdb.org' in poster_url:
+        return _TMDB_SIZE.sub(f"/t/p/w{POSTER_RENDITION_WIDTH}/", poster_url, count=1)
+    return _AMAZON_SIZE.sub(rf"._V1_SX{POSTER_RENDITION_WIDTH}.\1", poster_url)
+
+
+def decode_pixels(content: bytes, size: int = POSTER_SAMPLE_SIZE) -> np.ndarray:
+    """
+    Decodes image bytes into an (N, 3) float32 array of visible pixels.
+
+    JPEGs are decoded at reduced scale via draft mode; every image mode
+    (RGB, RGBA, L, P, CMYK, ...) is normalized through RGBA and fully
+    transparent pixels are dropped.
+
+    Args:
+        content: Encoded image
+        size: Longest side of the sampled buffer
+
+    Returns:
+        Pixel array with one RGB row per visible pixel
+    """
+    image = Image.open(io.BytesIO(content))
+    image.draft('RGB', (size, size))
+    image.thumbnail((size, size))
+    rgba = np.asarray(image.convert('RGBA'), dtype=np.float32).reshape(-1, 4)
+    return rgba[rgba[:, 3] > 0, :3]
+
+
+def download_poster(poster_url: str) -> bytes:
+    """
+    Downloads the small rendition of a poster.
+
+    Raises:
+        UpstreamError: The poster could not be downloaded
+        NotFound: The poster does not exist
+    """
+    try:
+        response = http_client.get('posters', small_rendition_url(poster_url))
+    except requests.exceptions.RequestException as error:
+        raise UpstreamError(str(error)) from error
+    if response.status_code == 404:
+        raise NotFound(poster_url)
+    if not response.ok:
+        raise UpstreamError(f"posters returned {response.status_code}")
+    return response.content
+
+
+def load_poster_pixels(poster_url: str) -> np.ndarray:
+    """
+    Downloads the small rendition of a poster and decodes its pixels.
+
+    Raises:
+        UpstreamError: The poster could not be downloaded
+        NotFound: The poster is missing or not a usable image
+    """
+    return _usable_pixels(download_poster(poster_url), poster_url)
+
+
+def _usable_pixels(content: bytes, poster_url: str) -> np.ndarray:
+    try:
+        pixels = decode_pixels(content)
+    except (OSError, ValueError) as error:
+        raise NotFound(poster_url) from error
+    if not len(pixels):
+        raise NotFound(poster_url)
+    return pixels
+
+
+def mean_color(pixels: np.ndarray) -> Color:
+    """Averages an (N, 3) pixel array into one RGB color."""
+    return tuple(int(channel) for channel in pixels.mean(axis=0).round())
+
+
+@negative_cached(lambda error: DEFAULT_POSTER_COLOR)
+@persistent_cache()
+@single_flight()
+def get_poster_color(poster_url: str) -> Color:
+    """
+    Extracts the average color from a movie poster.
+
+    Args:
+        poster_url: Poster URL (OMDB or TMDB, any size)
+
+    Returns:
+        RGB tuple; DEFAULT_POSTER_COLOR when the poster is unavailable
+    """
+    return mean_color(load_poster_pixels(poster_url))
+
+
+def kmeans_palette(pixels: np.ndarray, k: int = POSTER_PALETTE_SIZE,
+                   deadline: float = float('inf')) -> List[Color]:
+    """
+    Clusters pixels into at most `k` dominant colors.
+
+    Centroids start spread across the luminance range, so the result is
+    deterministic. Iteration stops on convergence, after
+    POSTER_KMEANS_ITERATIONS rounds, or once `deadline` (perf_counter time)
+    has passed, whichever comes first.
+
+    Args:
+        pixels: (N, 3) float pixel array
+        k: Number of colors wanted
+        deadline: perf_counter value after which no further round starts
+
+    Returns:
+        Colors ordered by the share of pixels they cover, largest first
+    """
+    k = max(1, min(k, len(pixels)))
+    luminance = pixels @ np.array([0.299, 0.587, 0.114], dtype=np.float32)
+    seeds = np.argsort(luminance)[np.linspace(0, len(pixels) - 1, k).astype(int)]
+    centroids = pixels[seeds].copy()
+
+    for _ in range(POSTER_KMEANS_ITERATIONS):
+        distances = ((pixels[:, None, :] - centroids[None, :, :]) ** 2).sum(axis=2)
+        labels = distances.argmin(axis=1)
+        counts = np.bincount(labels, minlength=k)
+        sums = np.stack([np.bincount(labels, weights=pixels[:, channel], minlength=k) for channel in range(3)], axis=1)
+
+        filled = counts > 0
+        updated = centroids.copy()
+        updated[filled] = sums[filled] / counts[filled, None]
+        converged = np.abs(updated - centroids).max() < 0.5
+        centroids = updated
+        if converged or time.perf_counter() >= deadline:
+            break
+
+    order = [cluster for cluster in np.argsort(-counts) if counts[cluster] > 0]
+    return [tuple(int(channel) for channel in centroids[cluster].round()) for cluster in order]
+
+
+@negative_cached(lambda error: [DEFAULT_POSTER_COLOR])
+@persistent_cache()
+@single_flight()
+def _poster_palette(rendition_url: str, k: int) -> List[Color]:
+    content = download_poster(rendition_url)
+    deadline = time.perf_counter() + POSTER_PALETTE_BUDGET_SECONDS
+    return kmeans_palette(_usable_pixels(content, rendition_url), k, deadline)
+
+
+def get_poster_palette(poster_url: str, k: int = POSTER_PALETTE_SIZE) -> List[Color]:
+    """
+    Extracts the dominant colors of a movie poster.
+
+    Decoding and clustering share a POSTER_PALETTE_BUDGET_SECONDS budget;
+    when it runs out the current centroids are returned. Palettes are keyed
+    by the small rendition URL, so any size of the same poster shares one
+    entry.
+
+    Args:
+        poster_url: Poster URL (OMDB or TMDB, any size)
+        k: Number of colors wanted
+
+    Returns:
+        Up to `k` RGB tuples, most dominant first; [DEFAULT_POSTER_COLOR]
+        when the poster is unavailable
+    """
+    return _poster_palette(small_rendition_url(poster_url), k)
+
+
+def precompute_palettes(poster_urls: Iterable[str], k: int = POSTER_PALETTE_SIZE,
+                        wait: bool = True) -> Dict[str, List[Color]]:
+    """
+    Computes palettes for a batch of posters on the shared executor.
+
+    Use it for lists about to be shown (trending, recommendations) so the
+    detail view finds its theme already cached. Called from a pool worker,
+    the batch runs inline whatever `wait` says, as nested fan-outs do in
+    api_handlers._resolve, so it is never dropped or queued behind the
+    worker running it.
+
+    Args:
+        poster_urls: Poster URLs; blanks and duplicates are skipped
+        k: Number of colors wanted per poster
+        wait: Block until every palette is ready; otherwise return at once
+            (ignored in a pool worker, which always computes inline)
+
+    Returns:
+        Dict of poster URL to palette (empty when not waiting outside a
+        pool worker)
+    """
+    urls = list(dict.fromkeys(url for url in poster_urls if url and url != 'N/A'))
+    if in_worker_thread():
+        return {url: get_poster_palette(url, k) for url in urls}
+
+    futures = {url: submit_stage('poster_palette', get_poster_palette, url, k) for url in urls}
+    if not wait:
+        return {}
+    return {url: future.result() for url, future in futures.items()}
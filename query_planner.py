@@ -0,0 +1,83 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          QUERY PLANNER MODULE
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+# Turns the sidebar filters (genre, year range) into TMDB /discover
+# parameters so filtering happens server-side, and streams the result pages
+# with a cap. A genre-only query is routed to the warm per-genre pages
+# (see genre_warmer) instead of a separate discover query.
+
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+from api_handlers import fetch_discover_page, fetch_movies_by_genre
+from config import DISCOVER_MAX_PAGES, DISCOVER_MIN_YEAR, GENRES
+from enrichment import submit
+
+
+class DiscoverPlan(NamedTuple):
+    """A filtered query: either warm genre pages or a /discover query."""
+    source: str                             # 'genre' or 'discover'
+    params: Tuple[Tuple[str, Any], ...]     # sorted /discover parameters
+    genre_id: Optional[int]
+
+
+def plan_query(selected_genre: str, year_range: Tuple[int, int]) -> Optional[DiscoverPlan]:
+    """
+    Plans a filtered movie query.
+
+    Filters left at their defaults ('All', the full year range) add no
+    parameters; a year bound at the slider's edge is dropped.
+
+    Args:
+        selected_genre: Key of config.GENRES
+        year_range: (first_year, last_year), inclusive
+
+    Returns:
+        DiscoverPlan, or None when no filter narrows anything
+    """
+    params: Dict[str, Any] = {'sort_by': 'popularity.desc'}
+    genre_id = GENRES.get(selected_genre)
+    if genre_id is not None:
+        params['with_genres'] = genre_id
+
+    first_year, last_year = year_range
+    if first_year > DISCOVER_MIN_YEAR:
+        params['primary_release_date.gte'] = f"{first_year}-01-01"
+    if last_year < datetime.now().year:
+        params['primary_release_date.lte'] = f"{last_year}-12-31"
+
+    if len(params) == 1:
+        return None
+    source = 'genre' if set(params) == {'sort_by', 'with_genres'} else 'discover'
+    return DiscoverPlan(source, tuple(sorted(params.items())), genre_id)
+
+
+def _fetch_page(plan: DiscoverPlan, page: int) -> Tuple[List[Dict], int]:
+    if plan.source == 'genre':
+        movies = fetch_movies_by_genre(plan.genre_id, page)
+        # Genre pages don't carry total_pages; an empty page ends the stream
+        return movies, page + 1 if movies else page
+    return fetch_discover_page(plan.params, page)
+
+
+def stream_pages(plan: DiscoverPlan, max_pages: int = DISCOVER_MAX_PAGES) -> Iterator[List[Dict]]:
+    """
+    Yields result pages as they arrive, fetching the next page while the
+    caller renders the current one.
+
+    Args:
+        plan: Result of plan_query
+        max_pages: Hard cap on pages fetched
+
+    Yields:
+        Lists of TMDB movie dictionaries, one per page
+    """
+    page = 1
+    pending = submit(_fetch_page, plan, page)
+    while pending is not None:
+        movies, total_pages = pending.result()
+        more = page < min(total_pages, max_pages) and bool(movies)
+        pending = submit(_fetch_page, plan, page + 1) if more else None
+        if movies:
+            yield movies
+        page += 1
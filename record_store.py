@@ -0,0 +1,119 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          RECORD STORE MODULE
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+# Process-wide store of movie records keyed by imdbID. Each record is kept
+# once, frozen into read-only mappings and tuples with its short strings
+# (genres, names, languages, ratings) interned, and every session viewing
+# the movie gets that same object. Sessions keep only the imdbID.
+
+import sys
+import threading
+from collections import Counter, OrderedDict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+from config import RECORD_INTERN_MAX_LENGTH, RECORD_STORE_MAX_ENTRIES
+from movie_record import MovieRecord
+
+
+def freeze(value: Any) -> Any:
+    """
+    Builds the compact, immutable form of a decoded JSON value.
+
+    Dicts become read-only mappings, lists become tuples, MovieRecords (already
+    immutable) are rebuilt around interned values, and strings up to
+    RECORD_INTERN_MAX_LENGTH characters are interned so repeated values
+    share one object across records.
+    """
+    if isinstance(value, str):
+        return sys.intern(value) if len(value) <= RECORD_INTERN_MAX_LENGTH else value
+    if isinstance(value, MovieRecord):
+        return MovieRecord(**{name: freeze(item) for name, item in value.items()})
+    if isinstance(value, Mapping):
+        return MappingProxyType({sys.intern(str(key)): freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Returns a plain dict/list copy of a frozen value (for st.json and other serializers)."""
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+
+class RecordStore:
+    """
+    Bounded LRU map of imdbID to frozen movie record.
+
+    `share` deduplicates: a record equal to the stored one is dropped in
+    favour of the stored object, so repeated cache hits from many sessions
+    converge on one copy.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._records: "OrderedDict[str, Mapping]" = OrderedDict()
+        self._stats = Counter()
+
+    def share(self, movie_data: Mapping) -> Mapping:
+        """
+        Returns the shared record for a movie, storing it if new or changed.
+
+        Args:
+            movie_data: MovieRecord or movie dict as returned by the fetchers
+
+        Returns:
+            Read-only record; the same object for every caller while the
+            movie's data is unchanged
+        """
+        imdb_id = movie_data.get('imdbID')
+        current = self.get(imdb_id)
+        if current is not None and (current is movie_data or current == movie_data):
+            with self._lock:
+                self._stats['shared'] += 1
+            return current
+
+        record = freeze(movie_data)
+        if not imdb_id:
+            return record
+
+        with self._lock:
+            self._records[imdb_id] = record
+            self._records.move_to_end(imdb_id)
+            self._stats['stored'] += 1
+            while len(self._records) > self.max_entries:
+                self._records.popitem(last=False)
+        return record
+
+    def get(self, imdb_id: Optional[str]) -> Optional[Mapping]:
+        """Returns the shared record for an imdbID, if still held."""
+        if not imdb_id:
+            return None
+        with self._lock:
+            record = self._records.get(imdb_id)
+            if record is not None:
+                self._records.move_to_end(imdb_id)
+            return record
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Reports store counters.
+
+        Returns:
+            Dict with records held, and stored/shared counts
+        """
+        with self._lock:
+            return {'records': len(self._records), **self._stats}
+
+
+movie_records = RecordStore(RECORD_STORE_MAX_ENTRIES)
+
+
+def get_record_store_stats() -> Dict[str, int]:
+    """Returns the process-wide record store counters."""
+    return movie_records.stats()
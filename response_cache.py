@@ -0,0 +1,278 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          RESPONSE CACHE MODULE
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+# Persistent SQLite tier that sits under the in-memory tier, so a restarted
+# process (or another replica on the same host) serves hot titles without
+# calling the upstream APIs. In stale-while-revalidate mode, expired
+# entries are served immediately and refreshed by a background worker.
+
+import functools
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+from config import (
+    PERSISTENT_CACHE_MAX_ENTRIES, PERSISTENT_CACHE_PATH,
+    STALE_REFRESH_WORKERS, STALE_HARD_TTL
+)
+
+
+class PersistentCache:
+    """
+    SQLite key/value store with per-entry TTLs and LRU eviction.
+
+    Entries are grouped by namespace (one per cached function). Reads
+    refresh `last_access`; once the table grows past `max_entries` the
+    least recently used rows are evicted.
+    """
+
+    def __init__(self, path: str, max_entries: int):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = None
+        self._entries = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    namespace   TEXT NOT NULL,
+                    key         TEXT NOT NULL,
+                    value       BLOB NOT NULL,
+                    expires_at  REAL,
+                    last_access REAL NOT NULL,
+                    PRIMARY KEY (namespace, key)
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses (last_access)")
+            self._entries = conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            self._conn = conn
+        return self._conn
+
+    def get(self, namespace: str, key: str) -> Tuple[bool, Any]:
+        """
+        Looks up an entry.
+
+        Returns:
+            Tuple of (hit, value); expired entries count as misses
+        """
+        hit, value, _ = self.lookup(namespace, key)
+        return hit, value
+
+    def lookup(self, namespace: str, key: str, stale_for: float = 0) -> Tuple[bool, Any, bool]:
+        """
+        Looks up an entry, optionally accepting it past its expiry.
+
+        Args:
+            namespace: Cache namespace
+            key: Entry key
+            stale_for: Seconds past expiry an entry may still be served
+
+        Returns:
+            Tuple of (hit, value, fresh)
+        """
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT value, expires_at FROM responses WHERE namespace = ? AND key = ?",
+                (namespace, key)
+            ).fetchone()
+            if row is None:
+                return False, None, False
+            if row[1] is not None and row[1] + stale_for <= now:
+                conn.execute("DELETE FROM responses WHERE namespace = ? AND key = ?", (namespace, key))
+                self._entries -= 1
+                return False, None, False
+            conn.execute(
+                "UPDATE responses SET last_access = ? WHERE namespace = ? AND key = ?",
+                (now, namespace, key)
+            )
+        fresh = row[1] is None or row[1] > now
+        return True, pickle.loads(row[0]), fresh
+
+    def set(self, namespace: str, key: str, value: Any, ttl: Optional[float]):
+        """Stores an entry; `ttl=None` keeps it until evicted."""
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        payload = sqlite3.Binary(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        with self._lock:
+            conn = self._connect()
+            inserted = conn.execute(
+                "SELECT 1 FROM responses WHERE namespace = ? AND key = ?", (namespace, key)
+            ).fetchone() is None
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (namespace, key, value, expires_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (namespace, key, payload, expires_at, now)
+            )
+            if inserted:
+                self._entries += 1
+            if self._entries > self.max_entries:
+                self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection):
+        """Drops expired rows, then least recently used rows down to 90% capacity."""
+        conn.execute("DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),))
+        self._entries = conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        excess = self._entries - int(self.max_entries * 0.9)
+        if excess > 0:
+            conn.execute(
+                "DELETE FROM responses WHERE rowid IN "
+                "(SELECT rowid FROM responses ORDER BY last_access LIMIT ?)",
+                (excess,)
+            )
+            self._entries -= excess
+
+
+_cache = PersistentCache(PERSISTENT_CACHE_PATH, PERSISTENT_CACHE_MAX_ENTRIES)
+
+
+_refresh_executor = ThreadPoolExecutor(max_workers=STALE_REFRESH_WORKERS, thread_name_prefix="cache-refresh")
+_refreshing = set()
+_refreshing_lock = threading.Lock()
+
+_metrics: Dict[str, Counter] = defaultdict(Counter)
+_metrics_lock = threading.Lock()
+
+
+def get_cache() -> PersistentCache:
+    """Returns the process-wide persistent cache."""
+    return _cache
+
+
+def _count(namespace: str, metric: str):
+    with _metrics_lock:
+        _metrics[namespace][metric] += 1
+
+
+def get_cache_metrics() -> Dict[str, Dict[str, int]]:
+    """
+    Reports persistent-tier counters per cached function.
+
+    Returns:
+        Dict of namespace to hits, misses, stale_hits, refreshes and
+        refresh_failures
+    """
+    with _metrics_lock:
+        return {namespace: dict(counts) for namespace, counts in _metrics.items()}
+
+
+def _refresh(namespace: str, key: str, fn: Callable, args: tuple, kwargs: dict,
+             ttl: Optional[float], cache_if: Callable[[Any], bool]):
+    """Recomputes a stale entry in the background and stores it if usable."""
+    try:
+        value = fn(*args, **kwargs)
+        if cache_if(value):
+            _cache.set(namespace, key, value, ttl)
+            _count(namespace, 'refreshes')
+        else:
+            _count(namespace, 'refresh_failures')  # Keep serving the stale copy
+    except Exception:
+        _count(namespace, 'refresh_failures')
+    finally:
+        with _refreshing_lock:
+            _refreshing.discard((namespace, key))
+
+
+def _schedule_refresh(namespace: str, key: str, *refresh_args):
+    """Queues one background refresh per stale entry."""
+    with _refreshing_lock:
+        if (namespace, key) in _refreshing:
+            return
+        _refreshing.add((namespace, key))
+    _refresh_executor.submit(_refresh, namespace, key, *refresh_args)
+
+
+def make_key(args: tuple, kwargs: dict) -> str:
+    """Builds a stable cache key from call arguments."""
+    return repr((args, sorted(kwargs.items())))
+
+
+def persistent_cache(ttl: Optional[float] = None, cache_if: Optional[Callable[[Any], bool]] = None,
+                     stale_while_revalidate: bool = False, hard_ttl: float = STALE_HARD_TTL):
+    """
+    Decorator adding the persistent tier to a fetcher.
+
+    Place it under the in-memory tier (@st.cache_data or @shared_cache) so
+    memory is checked first.
+    The decorated function gains `seed(value, *args)`, which fills the
+    entry for `args` from data fetched elsewhere, and `peek(*args)`, which
+    reads it without fetching; functools.wraps carries both up through the
+    outer decorators.
+    With `stale_while_revalidate`, give the in-memory tier a short TTL so that
+    refreshed entries are picked up promptly.
+
+    Args:
+        ttl: Seconds an entry stays valid; None keeps it until evicted
+        cache_if: Predicate deciding whether a result is worth persisting;
+            by default every returned value is (failures should raise)
+        stale_while_revalidate: Serve expired entries and refresh them in
+            the background
+        hard_ttl: Age in seconds after which an entry is never served
+
+    Returns:
+        Decorator for the fetcher
+    """
+    stale_for = max(0, hard_ttl - ttl) if stale_while_revalidate and ttl is not None else 0
+    cache_if = cache_if or (lambda value: True)
+
+    def decorator(fn: Callable) -> Callable:
+        namespace = fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = make_key(args, kwargs)
+            try:
+                hit, value, fresh = _cache.lookup(namespace, key, stale_for)
+                if hit:
+                    if fresh:
+                        _count(namespace, 'hits')
+                    else:
+                        _count(namespace, 'stale_hits')
+                        _schedule_refresh(namespace, key, fn, args, kwargs, ttl, cache_if)
+                    return value
+            except Exception:
+                pass  # Treat an unreadable cache as a miss
+
+            _count(namespace, 'misses')
+            value = fn(*args, **kwargs)
+
+            if cache_if(value):
+                try:
+                    _cache.set(namespace, key, value, ttl)
+                except sqlite3.Error:
+                    pass  # Persisting is best effort
+            return value
+
+        def seed(value: Any, *args, **kwargs):
+            """Stores `value` as the result for these arguments without calling the fetcher."""
+            try:
+                _cache.set(namespace, make_key(args, kwargs), value, ttl)
+            except sqlite3.Error:
+                pass  # Persisting is best effort
+
+        def peek(*args, **kwargs) -> Tuple[bool, Any]:
+            """Returns (hit, value) for these arguments, stale entries included, without fetching."""
+            try:
+                hit, value, _ = _cache.lookup(namespace, make_key(args, kwargs), stale_for)
+                return hit, value
+            except Exception:
+                return False, None
+
+        wrapper.seed = seed
+        wrapper.peek = peek
+        return wrapper
+
+    return decorator
@@ -0,0 +1,101 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          SCHEDULER MODULE
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+# Process-wide periodic background jobs. Streamlit re-executes the page
+# script on every interaction, but imported modules load once per process,
+# so jobs registered here run once per server, not once per session.
+
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+
+class PeriodicTask:
+    """Runs a function on a daemon thread every `interval` seconds."""
+
+    def __init__(self, name: str, interval: float, fn: Callable[[], None]):
+        self.name = name
+        self.interval = interval
+        self.fn = fn
+        self.runs = 0
+        self.failures = 0
+        self.last_run: Optional[float] = None
+        self.last_duration: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._loop, name=f"scheduler-{name}", daemon=True)
+
+    def start(self):
+        """Starts the background thread; the first run happens immediately."""
+        self._thread.start()
+
+    def stop(self):
+        """Ends the loop after the current run."""
+        self._stopped.set()
+        self._wake.set()
+
+    def run_now(self):
+        """Wakes the task for an immediate run instead of waiting out the interval."""
+        self._wake.set()
+
+    def _loop(self):
+        while not self._stopped.is_set():
+            started = time.perf_counter()
+            try:
+                self.fn()
+            except Exception as error:
+                self.failures += 1
+                self.last_error = repr(error)
+            else:
+                self.last_error = None
+            self.runs += 1
+            self.last_run = time.time()
+            self.last_duration = time.perf_counter() - started
+
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+    def stats(self) -> Dict:
+        """Reports run counts, the last run's time and duration, and the last error."""
+        return {
+            'interval': self.interval,
+            'runs': self.runs,
+            'failures': self.failures,
+            'last_run': self.last_run,
+            'last_duration_ms': round(self.last_duration * 1000, 2) if self.last_duration is not None else None,
+            'last_error': self.last_error,
+        }
+
+
+_tasks: Dict[str, PeriodicTask] = {}
+_tasks_lock = threading.Lock()
+
+
+def schedule(name: str, interval: float, fn: Callable[[], None]) -> PeriodicTask:
+    """
+    Starts a periodic task once per process; later calls return it.
+
+    The first run happens immediately.
+
+    Args:
+        name: Unique task name
+        interval: Seconds between the end of one run and the next
+        fn: Job; exceptions are recorded and the schedule continues
+
+    Returns:
+        The running PeriodicTask
+    """
+    with _tasks_lock:
+        task = _tasks.get(name)
+        if task is None:
+            task = _tasks[name] = PeriodicTask(name, interval, fn)
+            task.start()
+    return task
+
+
+def get_scheduler_stats() -> Dict[str, Dict]:
+    """Reports run counts, durations and last errors per task."""
+    with _tasks_lock:
+        return {name: task.stats() for name, task in _tasks.items()}
@@ -3,8 +3,16 @@
 #                          SESSION STATE MANAGER MODULE
 # ═══════════════════════════════════════════════════════════════════════════════
 
+import re
+import sqlite3
+import uuid
 import streamlit as st
-from config import SESSION_STATE_DEFAULTS
+from typing import List, Tuple
+from config import MAX_FAVORITES, MAX_HISTORY, SESSION_STATE_DEFAULTS, USER_LIST_PAGE_SIZE
+from movie_collections import MovieCollection, MovieEntry
+from user_store import get_user_store
+
+_USER_ID = re.compile(r"[A-Za-z0-9_-]{1,64}")
 
 
 def init_session_state():
@@ -13,109 +21,45 @@ def init_session_state():
         if key not in st.session_state:
             st.session_state[key] = value
 
-
-def get_search_query():
-    """Get current search query from session state."""
-    return st.session_state.get('search_query', '')
-
-
-def set_search_query(query: str):
-    """Set search query in session state."""
-    st.session_state.search_query = query
-
-
-def should_trigger_search():
-    """Check if search should be triggered."""
-    return st.session_state.get('should_search', False)
-
-
-def set_should_search(value: bool):
-    """Set the should_search flag."""
-    st.session_state.should_search = value
+    init_user_lists()
 
 
-def add_to_history(movie_title: str, movie_data: dict):
-    """Add a movie to search history."""
-    history = st.session_state.search_history
-    
-    # Remove if already exists to avoid duplicates
-    history = [m for m in history if m.get('title') != movie_title]
-    
-    # Add to beginning
-    history.insert(0, {
-        'title': movie_title,
-        'poster': movie_data.get('Poster', ''),
-        'year': movie_data.get('Year', ''),
-        'imdb_id': movie_data.get('imdbID', '')
-    })
-    
-    # Keep only last 10
-    st.session_state.search_history = history[:10]
-
-
-def add_to_favorites(movie_title: str, movie_data: dict):
-    """Add a movie to favorites."""
-    favorites = st.session_state.favorites
-    
-    # Check if already in favorites
-    if any(m.get('title') == movie_title for m in favorites):
-        return False
-    
-    favorites.append({
-        'title': movie_title,
-        'poster': movie_data.get('Poster', ''),
-        'imdb_id': movie_data.get('imdbID', ''),
-        'rating': movie_data.get('imdbRating', 'N/A')
-    })
-    
-    # Keep only last 20
-    st.session_state.favorites = favorites[:20]
-    return True
+def get_user_id() -> str:
+    """
+    Returns the ID the user's lists are stored under.
 
+    Taken from the `uid` query parameter, or generated and written back to
+    it, so a reload or a bookmarked URL reopens the same lists.
+    """
+    if 'user_id' not in st.session_state:
+        uid = st.query_params.get('uid', '')
+        if not _USER_ID.fullmatch(uid):
+            uid = uuid.uuid4().hex
+            st.query_params['uid'] = uid
+        st.session_state.user_id = uid
+    return st.session_state.user_id
 
-def is_favorite(movie_title: str) -> bool:
-    """Check if a movie is in favorites."""
-    return any(m.get('title') == movie_title for m in st.session_state.favorites)
 
+def init_user_lists():
+    """
+    Opens the user's history and favorites in the user store.
 
-def remove_from_favorites(movie_title: str):
-    """Remove a movie from favorites."""
-    st.session_state.favorites = [
-        m for m in st.session_state.favorites 
-        if m.get('title') != movie_title
-    ]
+    The lists are views that read nothing until used. If the store cannot
+    be opened, the session falls back to in-memory collections.
+    """
+    if 'search_history' in st.session_state and 'favorites' in st.session_state:
+        return
 
-
-def clear_history():
-    """Clear search history."""
-    st.session_state.search_history = []
-
-
-def clear_favorites():
-    """Clear all favorites."""
-    st.session_state.favorites = []
-
-
-def reset_search():
-    """Reset search state."""
-    st.session_state.search_query = ''
-    st.session_state.current_movie = None
-    st.session_state.search_suggestions = []
-    st.session_state.should_search = False
-
-# ═══════════════════════════════════════════════════════════════════════════════
-#                          SESSION STATE MANAGER MODULE
-# ═══════════════════════════════════════════════════════════════════════════════
-
-import streamlit as st
-from config import SESSION_STATE_DEFAULTS
-
-
-def init_session_state():
-    """Initialize all session state variables."""
-    for key, value in SESSION_STATE_DEFAULTS.items():
-        if key not in st.session_state:
-            st.session_state[key] = value
+    store = get_user_store()
+    uid = get_user_id()
+    try:
+        history = store.open_list(uid, 'history', MAX_HISTORY)
+        favorites = store.open_list(uid, 'favorites', MAX_FAVORITES)
+        len(history)  # Opens the database now rather than mid-render
+    except sqlite3.Error:
+        history, favorites = MovieCollection(MAX_HISTORY), MovieCollection(MAX_FAVORITES)
+    st.session_state.search_history = history
+    st.session_state.favorites = favorites
 
 
 def get_search_query():
@@ -139,65 +83,59 @@ def set_should_search(value: bool):
 
 
 def add_to_history(movie_title: str, movie_data: dict):
-    """Add a movie to search history."""
-    history = st.session_state.search_history
-    
-    # Remove if already exists to avoid duplicates
-    history = [m for m in history if m.get('title') != movie_title]
-    
-    # Add to beginning
-    history.insert(0, {
-        'title': movie_title,
-        'poster': movie_data.get('Poster', ''),
-        'year': movie_data.get('Year', ''),
-        'imdb_id': movie_data.get('imdbID', '')
-    })
-    
-    # Keep only last 10
-    st.session_state.search_history = history[:10]
-
-
-def add_to_favorites(movie_title: str, movie_data: dict):
-    """Add a movie to favorites."""
+    """Add a movie to search history, moving it to the front if already there."""
+    st.session_state.search_history.add(MovieEntry.from_movie(movie_title, movie_data))
+
+
+def remove_from_history(movie_key: str):
+    """Remove a movie (by imdbID or title) from search history."""
+    st.session_state.search_history.remove(movie_key)
+
+
+def add_to_favorites(movie_title: str, movie_data: dict) -> bool:
+    """Add a movie to favorites; returns False if it was already there."""
     favorites = st.session_state.favorites
-    
-    # Check if already in favorites
-    if any(m.get('title') == movie_title for m in favorites):
+    entry = MovieEntry.from_movie(movie_title, movie_data)
+    if entry.key in favorites:
         return False
-    
-    favorites.append({
-        'title': movie_title,
-        'poster': movie_data.get('Poster', ''),
-        'imdb_id': movie_data.get('imdbID', ''),
-        'rating': movie_data.get('imdbRating', 'N/A')
-    })
-    
-    # Keep only last 20
-    st.session_state.favorites = favorites[:20]
-    return True
+    return favorites.add(entry)
+
+
+def is_favorite(movie_key: str) -> bool:
+    """Check if a movie (by imdbID or title) is in favorites."""
+    return movie_key in st.session_state.favorites
+
+
+def remove_from_favorites(movie_key: str):
+    """Remove a movie (by imdbID or title) from favorites."""
+    st.session_state.favorites.remove(movie_key)
 
 
-def is_favorite(movie_title: str) -> bool:
-    """Check if a movie is in favorites."""
-    return any(m.get('title') == movie_title for m in st.session_state.favorites)
+def get_list_page(name: str, page: int) -> Tuple[List[MovieEntry], int]:
+    """
+    Loads one sidebar page of a user list.
 
+    Args:
+        name: 'search_history' or 'favorites'
+        page: Zero-based page number
 
-def remove_from_favorites(movie_title: str):
-    """Remove a movie from favorites."""
-    st.session_state.favorites = [
-        m for m in st.session_state.favorites 
-        if m.get('title') != movie_title
-    ]
+    Returns:
+        Tuple of (entries, total page count)
+    """
+    movies = st.session_state[name]
+    pages = max(1, -(-len(movies) // USER_LIST_PAGE_SIZE))
+    page = min(max(page, 0), pages - 1)
+    return movies.page(page * USER_LIST_PAGE_SIZE, USER_LIST_PAGE_SIZE), pages
 
 
 def clear_history():
     """Clear search history."""
-    st.session_state.search_history = []
+    st.session_state.search_history.clear()
 
 
 def clear_favorites():
     """Clear all favorites."""
-    st.session_state.favorites = []
+    st.session_state.favorites.clear()
 
 
 def reset_search():
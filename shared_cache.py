@@ -0,0 +1,127 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          SHARED CACHE MODULE
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+# Zero-copy alternative to st.cache_data. st.cache_data pickles results on
+# store and unpickles them on every hit, so each rerun of each session gets
+# its own deep copy. This tier freezes a result once (read-only mappings,
+# tuples, interned strings; see record_store.freeze) and hands the same
+# object to every caller until it expires.
+
+import functools
+import inspect
+import threading
+import time
+from collections import Counter, OrderedDict, defaultdict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+from config import SHARED_CACHE_MAX_ENTRIES
+from record_store import freeze
+from response_cache import make_key
+
+_metrics: Dict[str, Counter] = defaultdict(Counter)
+_metrics_lock = threading.Lock()
+
+
+def get_shared_cache_stats() -> Dict[str, Dict[str, int]]:
+    """
+    Reports shared-cache counters per cached function.
+
+    Returns:
+        Dict of namespace to hits, misses and evictions
+    """
+    with _metrics_lock:
+        return {namespace: dict(counts) for namespace, counts in _metrics.items()}
+
+
+def _count(namespace: str, metric: str):
+    with _metrics_lock:
+        _metrics[namespace][metric] += 1
+
+
+class SharedCache:
+    """Bounded LRU of frozen results with an optional TTL."""
+
+    def __init__(self, ttl: Optional[float], max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[Optional[float], Any]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Returns (hit, value); expired entries count as misses."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            if entry[0] is not None and entry[0] <= time.monotonic():
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            return True, entry[1]
+
+    def set(self, key: Hashable, value: Any) -> int:
+        """Stores a frozen value; returns the number of entries evicted."""
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        evicted = 0
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+        return evicted
+
+    def clear(self):
+        """Drops every entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+def shared_cache(ttl: Optional[float] = None, max_entries: int = SHARED_CACHE_MAX_ENTRIES):
+    """
+    Decorator caching frozen results in memory, shared by all sessions.
+
+    A drop-in for @st.cache_data in the fetcher stacks: exceptions are not
+    cached, parameters whose names start with an underscore are left out of
+    the key, and the wrapper has `clear()`. Results must not be mutated;
+    dicts come back as read-only mappings and lists as tuples.
+
+    Args:
+        ttl: Seconds an entry stays valid; None keeps it until evicted
+        max_entries: Entries kept for this function before LRU eviction
+
+    Returns:
+        Decorator for the fetcher
+    """
+    def decorator(fn: Callable) -> Callable:
+        namespace = fn.__qualname__
+        cache = SharedCache(ttl, max_entries)
+        signature = inspect.signature(fn)
+        hashed = [name for name in signature.parameters if not name.startswith('_')]
+
+        def key_of(args: tuple, kwargs: dict) -> Hashable:
+            if len(hashed) == len(signature.parameters):
+                return make_key(args, kwargs)
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return make_key(tuple(bound.arguments[name] for name in hashed), {})
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = key_of(args, kwargs)
+            hit, value = cache.get(key)
+            if hit:
+                _count(namespace, 'hits')
+                return value
+
+            _count(namespace, 'misses')
+            value = freeze(fn(*args, **kwargs))
+            evicted = cache.set(key, value)
+            if evicted:
+                _count(namespace, 'evictions')
+            return value
+
+        wrapper.clear = cache.clear
+        return wrapper
+
+    return decorator
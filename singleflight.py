@@ -0,0 +1,111 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          SINGLE-FLIGHT MODULE
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+# Collapses concurrent identical upstream lookups: the first caller for a
+# key does the work, later callers for the same key wait for it and share
+# its result (or its exception).
+
+import functools
+import threading
+from collections import Counter, defaultdict
+from typing import Any, Callable, Dict, Hashable, Optional
+from response_cache import make_key
+
+
+class _Call:
+    __slots__ = ('done', 'value', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class SingleFlight:
+    """Tracks in-flight calls by key and counts deduplicated callers."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._stats: Dict[str, Counter] = defaultdict(Counter)
+
+    def do(self, namespace: str, key: Hashable, fn: Callable, *args, **kwargs) -> Any:
+        """
+        Runs `fn` unless an identical call is already in flight.
+
+        Args:
+            namespace: Name used for the counters (usually the fetcher)
+            key: Normalized key identifying identical calls
+
+        Returns:
+            The leader's result; the leader's exception is re-raised to all
+        """
+        flight_key = (namespace, key)
+        with self._lock:
+            call = self._calls.get(flight_key)
+            leader = call is None
+            if leader:
+                call = self._calls[flight_key] = _Call()
+                self._stats[namespace]['executed'] += 1
+            else:
+                self._stats[namespace]['deduplicated'] += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        try:
+            call.value = fn(*args, **kwargs)
+            return call.value
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[flight_key]
+            call.done.set()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Reports counters per namespace.
+
+        Returns:
+            Dict of namespace to executed and deduplicated call counts
+        """
+        with self._lock:
+            return {namespace: dict(counts) for namespace, counts in self._stats.items()}
+
+
+_group = SingleFlight()
+
+
+def get_single_flight_stats() -> Dict[str, Dict[str, int]]:
+    """Returns the process-wide single-flight counters."""
+    return _group.stats()
+
+
+def single_flight(key_func: Optional[Callable[..., Hashable]] = None):
+    """
+    Decorator sharing one upstream call among concurrent identical callers.
+
+    Args:
+        key_func: Builds the dedup key from the call arguments; defaults
+            to the arguments themselves
+
+    Returns:
+        Decorator for the fetcher
+    """
+    def decorator(fn: Callable) -> Callable:
+        namespace = fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = key_func(*args, **kwargs) if key_func else make_key(args, kwargs)
+            return _group.do(namespace, key, fn, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
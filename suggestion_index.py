@@ -0,0 +1,129 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          SUGGESTION INDEX MODULE
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+# Local autocomplete index over titles already seen in TMDB suggestions,
+# trending results and looked-up movies. Each title is indexed under every
+# word start of its canonical form ("the dark knight", "dark knight",
+# "knight") in one sorted array, so a prefix query is a bisect plus a
+# short scan. Only prefixes TMDB has fully answered are served locally;
+# for anything else the local hits are provisional until TMDB's arrive.
+
+import threading
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional
+from config import SUGGESTION_INDEX_MAX_TITLES
+from title_index import canonicalize_title
+
+SUGGESTION_LIMIT = 8
+
+
+class SuggestionIndex:
+    """
+    Prefix index returning suggestion dicts ({id, title, year, poster, rating}).
+
+    A query is answered locally only when TMDB already returned a short
+    (complete) list for a prefix of it, so every match is indexed. Other
+    queries go to TMDB; `provisional` gives the local hits to show
+    meanwhile, and the results are fed back in.
+    """
+
+    def __init__(self, max_titles: int):
+        self.max_titles = max_titles
+        self._lock = threading.Lock()
+        self._keys: List[str] = []
+        self._records: "OrderedDict[int, Dict]" = OrderedDict()
+        self._complete_prefixes = set()
+
+    @staticmethod
+    def _keys_for(movie_id: int, title: str) -> List[str]:
+        words = canonicalize_title(title).split(' ')
+        return [f"{' '.join(words[i:])}\x00{movie_id}" for i in range(len(words)) if words[i]]
+
+    def add(self, suggestions: Iterable[Dict]):
+        """Indexes suggestion dicts; already indexed IDs are refreshed in place."""
+        with self._lock:
+            for suggestion in suggestions:
+                movie_id = suggestion.get('id')
+                title = suggestion.get('title')
+                if movie_id is None or not title:
+                    continue
+                if movie_id in self._records:
+                    self._records[movie_id] = dict(suggestion)
+                    continue
+                self._records[movie_id] = dict(suggestion)
+                for key in self._keys_for(movie_id, title):
+                    insort(self._keys, key)
+
+            if len(self._records) > self.max_titles:
+                self._evict()
+
+    def _evict(self):
+        """Drops the oldest tenth of titles and rebuilds the key array."""
+        for _ in range(len(self._records) - int(self.max_titles * 0.9)):
+            self._records.popitem(last=False)
+        self._keys = sorted(
+            key for movie_id, record in self._records.items()
+            for key in self._keys_for(movie_id, record['title'])
+        )
+        self._complete_prefixes.clear()
+
+    def record_search(self, query: str, suggestions: List[Dict]):
+        """Feeds TMDB results for `query` back into the index."""
+        self.add(suggestions)
+        if len(suggestions) < SUGGESTION_LIMIT:
+            with self._lock:
+                if len(self._complete_prefixes) >= self.max_titles:
+                    self._complete_prefixes.clear()
+                self._complete_prefixes.add(canonicalize_title(query))
+
+    def _ranked_matches(self, prefix: str) -> List[Dict]:
+        matches = {}
+        for position in range(bisect_left(self._keys, prefix), len(self._keys)):
+            key = self._keys[position]
+            if not key.startswith(prefix):
+                break
+            record = self._records.get(int(key.rsplit('\x00', 1)[1]))
+            if record is not None:
+                matches[record['id']] = record
+        ranked = sorted(matches.values(), key=lambda record: (-(record.get('rating') or 0), len(record['title'])))
+        return [dict(record) for record in ranked[:SUGGESTION_LIMIT]]
+
+    def search(self, query: str) -> Optional[List[Dict]]:
+        """
+        Answers a suggestion query locally.
+
+        Args:
+            query: Raw query as typed
+
+        Returns:
+            Up to 8 suggestion dicts ranked by rating, or None when TMDB
+            has not fully answered a prefix of the query and should be asked
+        """
+        prefix = canonicalize_title(query)
+        if not prefix:
+            return None
+
+        with self._lock:
+            if not any(prefix[:end] in self._complete_prefixes for end in range(1, len(prefix) + 1)):
+                return None
+            return self._ranked_matches(prefix)
+
+    def provisional(self, query: str) -> List[Dict]:
+        """Returns the indexed matches for a query, to show until TMDB answers."""
+        prefix = canonicalize_title(query)
+        if not prefix:
+            return []
+        with self._lock:
+            return self._ranked_matches(prefix)
+
+
+suggestion_index = SuggestionIndex(SUGGESTION_INDEX_MAX_TITLES)
+
+
+def merge_suggestions(remote: List[Dict], local: List[Dict]) -> List[Dict]:
+    """Keeps TMDB's ranking and fills any remaining slots with local hits it lacked."""
+    seen = {suggestion['id'] for suggestion in remote}
+    extra = [suggestion for suggestion in local if suggestion['id'] not in seen]
+    return (list(remote) + extra)[:SUGGESTION_LIMIT]
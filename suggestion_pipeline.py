@@ -0,0 +1,146 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          SUGGESTION PIPELINE MODULE
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+# Moves search-as-you-type fetching off the page render. Each keystroke
+# replaces the session's pending query: a fetch starts only after the input
+# has been quiet for SUGGESTION_DEBOUNCE_SECONDS, superseded fetches are
+# cancelled or their results dropped, and the page polls for whatever
+# arrived last instead of waiting on TMDB. Locally known matches can be
+# shown in the meantime.
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+from config import SUGGESTION_DEBOUNCE_SECONDS, SUGGESTION_WORKERS
+
+_executor = ThreadPoolExecutor(max_workers=SUGGESTION_WORKERS, thread_name_prefix="suggestions")
+
+
+class SuggestionPipeline:
+    """
+    Per-session debounced suggestion fetcher.
+
+    Keep one instance in st.session_state; `submit` on every input change
+    and `results` on every render.
+    """
+
+    def __init__(self, debounce: float = SUGGESTION_DEBOUNCE_SECONDS):
+        self.debounce = debounce
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._query = ''
+        self._timer: Optional[threading.Timer] = None
+        self._future: Optional[Future] = None
+        self._results_query = ''
+        self._results: List[Dict] = []
+
+    def submit(self, query: str, fetch: Callable[[str], List[Dict]],
+               local: Optional[Callable[[str], Optional[List[Dict]]]] = None,
+               provisional: Optional[Callable[[str], List[Dict]]] = None):
+        """
+        Schedules suggestions for `query`, superseding any earlier query.
+
+        Args:
+            query: Current contents of the search box
+            fetch: Blocking suggestion fetcher (e.g. fetch_search_suggestions)
+            local: Optional instant lookup; when it answers, no fetch is made
+            provisional: Optional instant lookup whose hits are shown until
+                the fetch returns; the query stays pending meanwhile
+        """
+        with self._lock:
+            if query == self._query:
+                return
+            self._generation += 1
+            generation = self._generation
+            self._query = query
+            self._cancel_pending()
+
+            if not query or len(query) < 2:
+                self._publish(generation, query, [])
+                return
+
+        answer = local(query) if local else None
+        if answer is not None:
+            with self._lock:
+                self._publish(generation, query, answer)
+            return
+
+        hits = provisional(query) if provisional else None
+        if hits:
+            with self._lock:
+                if generation == self._generation:
+                    self._results = list(hits)
+
+        timer = threading.Timer(self.debounce, self._start, (generation, query, fetch))
+        timer.daemon = True
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._timer = timer
+        timer.start()
+
+    def _cancel_pending(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._future is not None:
+            self._future.cancel()  # No-op once running; the result is dropped instead
+            self._future = None
+
+    def _start(self, generation: int, query: str, fetch: Callable[[str], List[Dict]]):
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._timer = None
+            self._future = _executor.submit(fetch, query)
+            self._future.add_done_callback(lambda future: self._finish(generation, query, future))
+
+    def _finish(self, generation: int, query: str, future: Future):
+        if future.cancelled():
+            return
+        try:
+            suggestions = future.result()
+        except Exception:
+            suggestions = []
+        with self._lock:
+            if generation == self._generation:
+                self._future = None
+            self._publish(generation, query, suggestions)
+
+    def _publish(self, generation: int, query: str, suggestions: List[Dict]):
+        if generation == self._generation:
+            self._results_query = query
+            self._results = list(suggestions or [])
+
+    @property
+    def pending(self) -> bool:
+        """True while the latest query's suggestions have not arrived."""
+        with self._lock:
+            return self._results_query != self._query
+
+    def results(self) -> List[Dict]:
+        """
+        Returns the suggestions for the latest query that has completed.
+
+        Returns:
+            List of suggestion dictionaries; may lag the input while pending
+        """
+        with self._lock:
+            return list(self._results)
+
+
+def get_pipeline(state) -> SuggestionPipeline:
+    """
+    Returns the session's pipeline, creating it on first use.
+
+    Args:
+        state: st.session_state (any mutable mapping)
+
+    Returns:
+        SuggestionPipeline bound to that session
+    """
+    pipeline = state.get('suggestion_pipeline')
+    if pipeline is None:
+        pipeline = state['suggestion_pipeline'] = SuggestionPipeline()
+    return pipeline
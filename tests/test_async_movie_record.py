@@ -0,0 +1,38 @@
+"""
+Records from the asyncio fetcher load their full payload like sync ones.
+"""
+
+import asyncio
+import copy
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+async_api_handlers = pytest.importorskip("async_api_handlers")
+
+import response_cache  # noqa: E402
+
+OMDB = {
+    'Response': 'True', 'Title': 'Arrival', 'Year': '2016', 'imdbID': 'tt2543164', 'Poster': 'N/A',
+    'Genre': 'Drama, Sci-Fi', 'Director': 'Denis Villeneuve', 'BoxOffice': '$100,546,139',
+}
+
+
+def test_async_record_raw_returns_the_full_payload(tmp_path, monkeypatch):
+    monkeypatch.setattr(response_cache, '_cache', response_cache.PersistentCache(str(tmp_path / 'responses.sqlite3'), 100))
+    monkeypatch.setitem(async_api_handlers.api_core.API_KEYS, 'tmdb', '')
+
+    async def perform(request, session):
+        return copy.deepcopy(OMDB)
+
+    monkeypatch.setattr(async_api_handlers, '_perform', perform)
+
+    record, error = asyncio.run(async_api_handlers.fetch_movie_data('Arrival async payload'))
+
+    assert error is None
+    assert 'BoxOffice' not in record
+    assert record.raw['BoxOffice'] == OMDB['BoxOffice']
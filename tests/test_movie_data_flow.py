@@ -0,0 +1,60 @@
+"""
+The speculative TMDB lookup in movie_data_flow stops once OMDB has missed.
+"""
+
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import api_core  # noqa: E402
+import api_handlers  # noqa: E402
+
+OMDB_HIT = {'Response': 'True', 'Title': 'Heat', 'Year': '1995', 'imdbID': 'tt0113277'}
+OMDB_MISS = {'Response': 'False', 'Error': api_core.OMDB_NOT_FOUND}
+TMDB_SEARCH = {'results': [{'id': 949, 'title': 'Heat'}]}
+TMDB_DETAILS = {'id': 949, 'imdb_id': 'tt0113277', 'tagline': 'A Los Angeles crime saga'}
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """Fake transport: OMDB answers at once, TMDB after a short delay; records endpoints."""
+    monkeypatch.setitem(api_core.API_KEYS, 'tmdb', 'test-key')
+    requested = []
+    lock = threading.Lock()
+    answers = {'tmdb.search': TMDB_SEARCH, 'tmdb.details': TMDB_DETAILS}
+
+    def perform(request):
+        with lock:
+            requested.append(request.endpoint)
+        if request.endpoint == 'omdb':
+            return dict(upstream.omdb)
+        time.sleep(0.1)
+        return answers[request.endpoint]
+
+    monkeypatch.setattr(api_handlers, '_perform', perform)
+    upstream.omdb = OMDB_HIT
+    upstream.requested = requested
+    return upstream
+
+
+def test_omdb_miss_skips_the_speculative_details_request(upstream):
+    upstream.omdb = OMDB_MISS
+
+    with pytest.raises(api_core.NotFound):
+        api_handlers.run_flow(api_core.movie_data_flow('No Such Movie'))
+
+    assert 'tmdb.details' not in upstream.requested
+
+
+def test_omdb_hit_uses_the_speculative_details(upstream):
+    movie_data, error = api_handlers.run_flow(api_core.movie_data_flow('Heat'))
+
+    assert error is None
+    assert movie_data['tmdb_id'] == 949
+    assert sorted(upstream.requested) == ['omdb', 'tmdb.details', 'tmdb.search']
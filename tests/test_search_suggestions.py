@@ -0,0 +1,62 @@
+"""
+Typing into the search boxes of both apps, driven through Streamlit's AppTest.
+
+Each keystroke is a full-app rerun while a suggestion fetch is pending;
+none of them may raise, and the suggestions must appear once the
+background fetch lands.
+"""
+
+import os
+import sys
+import time
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+AppTest = pytest.importorskip("streamlit.testing.v1").AppTest
+
+import api_handlers  # noqa: E402
+from config import SUGGESTION_DEBOUNCE_SECONDS  # noqa: E402
+
+QUERY = "interst"
+SUGGESTION = {'id': 157336, 'title': 'Interstellar', 'year': '2014', 'poster': None, 'rating': 8.4}
+
+
+@pytest.fixture
+def slow_tmdb(monkeypatch):
+    """Replaces the TMDB suggestion call with a slow canned answer."""
+    def fetch(query):
+        time.sleep(0.5)
+        return [SUGGESTION]
+
+    monkeypatch.setattr(api_handlers, '_fetch_search_suggestions', fetch)
+
+
+def type_query(app: AppTest, key: str):
+    for end in range(1, len(QUERY) + 1):
+        app.text_input(key=key).input(QUERY[:end]).run()
+        assert not app.exception, app.exception
+
+
+def wait_for_suggestions(app: AppTest) -> list:
+    deadline = time.monotonic() + SUGGESTION_DEBOUNCE_SECONDS + 5
+    while time.monotonic() < deadline:
+        app.run()
+        assert not app.exception, app.exception
+        labels = [button.label for button in app.button if 'Interstellar' in str(button.label)]
+        if labels:
+            return labels
+        time.sleep(0.1)
+    return []
+
+
+@pytest.mark.parametrize('script, key', [('mainapp.py', 'search_query'), ('test.py', 'search_input')])
+def test_typing_a_query_shows_suggestions_without_errors(slow_tmdb, script, key):
+    app = AppTest.from_file(os.path.join(ROOT, script), default_timeout=30).run()
+    assert not app.exception, app.exception
+
+    type_query(app, key)
+
+    assert wait_for_suggestions(app)
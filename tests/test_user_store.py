@@ -0,0 +1,37 @@
+"""
+User store lists opened by several sessions (browser tabs) with one uid.
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from movie_collections import MovieEntry  # noqa: E402
+from user_store import UserStore  # noqa: E402
+
+
+def entry(n: int) -> MovieEntry:
+    return MovieEntry(f'tt{n:07d}', f'Movie {n}', '2000', None, '7.0', 1000.0 + n)
+
+
+def test_tabs_sharing_a_uid_agree_on_count_and_capacity(tmp_path):
+    store = UserStore(str(tmp_path / 'users.sqlite3'))
+    first_tab = store.open_list('uid', 'favorites', 3)
+    second_tab = store.open_list('uid', 'favorites', 3)
+
+    for n in range(3):
+        first_tab.add(entry(n))
+    assert len(second_tab) == 3
+
+    second_tab.add(entry(3))
+    first_tab.add(entry(4))
+    assert len(first_tab) == len(second_tab) == 3
+    assert [e.imdb_id for e in first_tab.page(0, 10)] == ['tt0000004', 'tt0000003', 'tt0000002']
+
+    assert second_tab.remove('Movie 4')
+    assert len(first_tab) == 2
+
+    first_tab.clear()
+    assert len(second_tab) == 0
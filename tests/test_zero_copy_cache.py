@@ -0,0 +1,151 @@
+"""
+Zero-copy cache mode: every fetcher result is read-only on every path.
+
+Cache hits, fresh misses and failure fallbacks must come back as the same
+frozen types, and both apps must render a detail page (every tab) from
+them. Upstream HTTP is replaced by canned payloads, and the SQLite stores
+by throwaway files.
+"""
+
+import copy
+import os
+import sys
+from collections.abc import Mapping
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+AppTest = pytest.importorskip("streamlit.testing.v1").AppTest
+
+import api_handlers  # noqa: E402
+import response_cache  # noqa: E402
+import user_store  # noqa: E402
+from api_core import UpstreamError  # noqa: E402
+
+RECOMMENDATIONS = [
+    {'id': 27205, 'title': 'Inception', 'poster_path': None, 'vote_average': 8.4, 'release_date': '2010-07-15'},
+]
+VIDEOS = {'results': [{'site': 'YouTube', 'key': 'zSWdZVtXT7E', 'type': 'Trailer', 'official': True}]}
+PAYLOADS = {
+    'omdb': {
+        'Response': 'True', 'Title': 'Interstellar', 'Year': '2014', 'imdbID': 'tt0816692', 'Poster': 'N/A',
+        'imdbRating': '8.7', 'Metascore': '74', 'Runtime': '169 min', 'Genre': 'Adventure, Drama, Sci-Fi',
+        'Director': 'Christopher Nolan', 'Writer': 'Jonathan Nolan', 'Country': 'United States',
+        'Actors': 'Matthew McConaughey, Anne Hathaway', 'Plot': 'Explorers travel through a wormhole.',
+    },
+    'tmdb.search': {'results': [
+        {'id': 157336, 'title': 'Interstellar', 'release_date': '2014-11-05', 'poster_path': None, 'vote_average': 8.4},
+    ]},
+    'tmdb.find': {'movie_results': [{'id': 157336}]},
+    'tmdb.details': {
+        'id': 157336, 'imdb_id': 'tt0816692', 'tagline': 'Mankind was born on Earth.', 'poster_path': None,
+        'vote_average': 8.4, 'recommendations': {'results': RECOMMENDATIONS}, 'videos': VIDEOS,
+    },
+    'tmdb.recommendations': {'results': RECOMMENDATIONS},
+    'tmdb.videos': VIDEOS,
+    'tmdb.discover': {'results': RECOMMENDATIONS, 'total_pages': 1},
+    'watchmode': {'sources': [
+        {'source_id': 203, 'name': 'Netflix', 'web_url': 'https://www.netflix.com/title/70305903', 'type': 'sub'},
+    ]},
+    'youtube': {'items': [{'id': {'videoId': 'zSWdZVtXT7E'}}]},
+}
+PAYLOADS['tmdb.trending'] = PAYLOADS['tmdb.search']
+
+
+@pytest.fixture(autouse=True)
+def isolated_stores(tmp_path, monkeypatch):
+    monkeypatch.setattr(response_cache, '_cache', response_cache.PersistentCache(str(tmp_path / 'responses.sqlite3'), 100))
+    monkeypatch.setattr(user_store, '_store', user_store.UserStore(str(tmp_path / 'users.sqlite3')))
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """Answers every request with its canned payload (a fresh copy, as HTTP would)."""
+    def perform(request):
+        return copy.deepcopy(PAYLOADS[request.endpoint])
+
+    monkeypatch.setattr(api_handlers, '_perform', perform)
+
+
+@pytest.fixture
+def failing_upstream(monkeypatch):
+    def perform(request):
+        raise UpstreamError(f"{request.endpoint}: 503")
+
+    monkeypatch.setattr(api_handlers, '_perform', perform)
+
+
+def assert_frozen(value):
+    """Fails on any list or dict reachable from a fetcher result."""
+    assert not isinstance(value, (list, dict, set)), f"mutable {type(value).__name__} in a fetcher result"
+    if isinstance(value, Mapping):
+        for item in value.values():
+            assert_frozen(item)
+    elif isinstance(value, tuple):
+        for item in value:
+            assert_frozen(item)
+
+
+def test_zero_copy_mode_is_on():
+    assert api_handlers.ZERO_COPY_CACHE
+
+
+def test_misses_and_hits_share_one_frozen_object(upstream):
+    for fetch, args in ((api_handlers.fetch_recommendations, (910001,)),
+                        (api_handlers.fetch_streaming_info, ('tt9100001',)),
+                        (api_handlers.fetch_movies_by_genre, (910001, 1)),
+                        (api_handlers.fetch_discover_page, ((('with_genres', 910001),), 1))):
+        miss = fetch(*args)
+        assert_frozen(miss)
+        assert fetch(*args) is miss
+
+    suggestions = api_handlers.fetch_search_suggestions('interstellar zero copy')
+    assert suggestions and isinstance(suggestions, tuple)
+    assert_frozen(suggestions)
+
+    movie, error = api_handlers.fetch_movie_data('Interstellar')
+    assert error is None
+    assert_frozen(movie)
+
+
+def test_failure_fallbacks_are_frozen_like_hits(failing_upstream):
+    assert api_handlers.fetch_recommendations(920001) == ()
+    assert api_handlers.fetch_streaming_info('tt9200001') == ()
+    assert api_handlers.fetch_movies_by_genre(920001, 1) == ()
+    assert api_handlers.fetch_discover_page((('with_genres', 920001),), 1) == ((), 0)
+    assert api_handlers.fetch_search_suggestions('failing zero copy') == ()
+    assert api_handlers.fetch_search_suggestions('x') == ()
+    assert api_handlers.fetch_youtube_trailer('Failing Zero Copy', '2001') is None
+
+
+def rendered_text(app: AppTest) -> str:
+    return ' '.join(str(element.value) for element in [*app.markdown, *app.caption])
+
+
+@pytest.mark.parametrize('tab, marker', [("🎬 TRAILER", None), ("📺 STREAMING", 'Netflix'), ("🤖 SIMILAR", 'Inception')])
+def test_test_app_detail_tabs_render_frozen_results(upstream, tab, marker):
+    app = AppTest.from_file(os.path.join(ROOT, 'test.py'), default_timeout=30)
+    app.session_state['search_query'] = 'Interstellar'
+    app.session_state['should_search'] = True
+    app.session_state['detail_tab'] = tab
+    app.run()
+
+    assert not app.exception, app.exception
+    assert 'Interstellar' in rendered_text(app)
+    if marker:
+        assert marker in rendered_text(app)
+    else:
+        assert len(app.get('video')) == 1
+
+
+def test_mainapp_detail_page_renders_frozen_results(upstream):
+    app = AppTest.from_file(os.path.join(ROOT, 'mainapp.py'), default_timeout=30)
+    app.session_state['search_query'] = 'Interstellar'
+    app.session_state['should_search'] = True
+    app.run()
+
+    assert not app.exception, app.exception
+    assert 'Interstellar' in rendered_text(app)
+    assert len(app.get('video')) == 1
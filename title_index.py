@@ -0,0 +1,98 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          TITLE INDEX MODULE
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+# Canonical query keys for title lookups, plus an alias index mapping each
+# canonical query to the imdbID it resolved to. "inception", "Inception "
+# and "INCEPTION" share one key; "the dark knight" and "The Dark Knight"
+# both alias tt0468569 once either has been resolved.
+
+import re
+import threading
+import unicodedata
+from collections import defaultdict
+from typing import Dict, Optional, Set
+from response_cache import PersistentCache, get_cache
+
+_APOSTROPHES = re.compile(r"['’‘`´]")
+_SEPARATORS = re.compile(r"[\W_]+", re.UNICODE)
+
+
+def canonicalize_title(title: str) -> str:
+    """
+    Builds the cache key for a title query.
+
+    Applies Unicode compatibility normalization, strips accents, case-folds,
+    drops apostrophes and collapses punctuation and whitespace runs to a
+    single space.
+
+    Args:
+        title: Raw query as typed
+
+    Returns:
+        Canonical query key
+    """
+    text = unicodedata.normalize('NFKD', title or '')
+    text = ''.join(char for char in text if not unicodedata.combining(char))
+    text = _APOSTROPHES.sub('', text.casefold())
+    return _SEPARATORS.sub(' ', text).strip()
+
+
+class TitleAliasIndex:
+    """
+    Maps canonical query keys to imdbIDs, and imdbIDs back to their aliases.
+
+    Aliases are kept in memory and mirrored to the persistent cache so a
+    restarted process still knows which record a query resolves to.
+    """
+
+    NAMESPACE = 'title_aliases'
+
+    def __init__(self, cache: PersistentCache):
+        self._cache = cache
+        self._lock = threading.Lock()
+        self._aliases: Dict[str, str] = {}
+        self._by_imdb_id: Dict[str, Set[str]] = defaultdict(set)
+
+    def resolve(self, query_key: str) -> Optional[str]:
+        """Returns the imdbID a canonical query resolved to, if known."""
+        with self._lock:
+            imdb_id = self._aliases.get(query_key)
+        if imdb_id is not None:
+            return imdb_id
+
+        try:
+            hit, imdb_id = self._cache.get(self.NAMESPACE, query_key)
+        except Exception:
+            return None
+        if hit:
+            with self._lock:
+                self._aliases[query_key] = imdb_id
+                self._by_imdb_id[imdb_id].add(query_key)
+            return imdb_id
+        return None
+
+    def add(self, query_key: str, imdb_id: str):
+        """Records that `query_key` resolved to `imdb_id`."""
+        if not query_key or not imdb_id:
+            return
+        with self._lock:
+            if self._aliases.get(query_key) == imdb_id:
+                return
+            previous = self._aliases.get(query_key)
+            if previous is not None:
+                self._by_imdb_id[previous].discard(query_key)
+            self._aliases[query_key] = imdb_id
+            self._by_imdb_id[imdb_id].add(query_key)
+        try:
+            self._cache.set(self.NAMESPACE, query_key, imdb_id, None)
+        except Exception:
+            pass  # The in-memory alias still applies
+
+    def aliases(self, imdb_id: str) -> Set[str]:
+        """Returns every known query key that resolved to `imdb_id`."""
+        with self._lock:
+            return set(self._by_imdb_id.get(imdb_id, ()))
+
+
+title_aliases = TitleAliasIndex(get_cache())
@@ -0,0 +1,166 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          TRAILER RESOLVER MODULE
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+# Tiered trailer lookups persisted per imdbID: TMDB's videos list first,
+# YouTube Data API search (REST, no client library) only as a fallback.
+# Cold (upstream) and warm (cache) resolutions are timed against their
+# latency budgets, and resolution sources are counted to show the YouTube
+# quota saved.
+
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, Optional
+import api_core
+from api_core import Flow
+from config import (
+    TRAILER_CACHE_TTL, TRAILER_COLD_BUDGET_MS, TRAILER_MISS_TTL, TRAILER_WARM_BUDGET_MS,
+    YOUTUBE_SEARCH_QUOTA_COST
+)
+from response_cache import get_cache
+from title_index import canonicalize_title
+
+TRAILERS_NAMESPACE = 'trailers'
+
+
+class LatencyBudget:
+    """Per-kind latency counters checked against millisecond budgets."""
+
+    def __init__(self, budgets_ms: Dict[str, float]):
+        self.budgets_ms = budgets_ms
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, float]] = {}
+
+    def record(self, kind: str, elapsed: float):
+        """Adds one resolution time in seconds."""
+        elapsed_ms = elapsed * 1000
+        with self._lock:
+            entry = self._entries.setdefault(kind, {'calls': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'over_budget': 0})
+            entry['calls'] += 1
+            entry['total_ms'] += elapsed_ms
+            entry['max_ms'] = max(entry['max_ms'], elapsed_ms)
+            if elapsed_ms > self.budgets_ms.get(kind, float('inf')):
+                entry['over_budget'] += 1
+
+    def report(self) -> Dict[str, Dict[str, float]]:
+        """
+        Summarizes latencies per kind.
+
+        Returns:
+            Dict of kind to call count, average and max ms, budget and
+            number of calls over budget
+        """
+        with self._lock:
+            return {
+                kind: {
+                    'calls': int(entry['calls']),
+                    'avg_ms': round(entry['total_ms'] / entry['calls'], 2),
+                    'max_ms': round(entry['max_ms'], 2),
+                    'budget_ms': self.budgets_ms.get(kind),
+                    'over_budget': int(entry['over_budget']),
+                }
+                for kind, entry in self._entries.items()
+            }
+
+
+_latency = LatencyBudget({'cold': TRAILER_COLD_BUDGET_MS, 'warm': TRAILER_WARM_BUDGET_MS})
+_sources = Counter()
+_sources_lock = threading.Lock()
+
+
+def get_trailer_latency() -> Dict[str, Dict[str, float]]:
+    """
+    Returns trailer resolution latencies.
+
+    'cold' and 'warm' are checked against their budgets; 'tmdb',
+    'youtube' and 'not_found' break cold resolutions down by source.
+    """
+    return _latency.report()
+
+
+def record_resolution(source: str, elapsed: float):
+    """Counts one resolution by source ('cache', 'tmdb', 'youtube', 'not_found')."""
+    with _sources_lock:
+        _sources[source] += 1
+    _latency.record('warm' if source == 'cache' else 'cold', elapsed)
+    if source != 'cache':
+        _latency.record(source, elapsed)
+
+
+def get_trailer_sources() -> Dict[str, int]:
+    """
+    Reports where trailers were resolved and the YouTube quota involved.
+
+    Returns:
+        Dict of per-source counts plus 'youtube_quota_used' and
+        'youtube_quota_saved' (searches avoided by the cache or TMDB)
+    """
+    with _sources_lock:
+        sources = dict(_sources)
+    searches = sources.get('youtube', 0) + sources.get('not_found', 0)
+    avoided = sources.get('cache', 0) + sources.get('tmdb', 0)
+    return {
+        **sources,
+        'youtube_quota_used': searches * YOUTUBE_SEARCH_QUOTA_COST,
+        'youtube_quota_saved': avoided * YOUTUBE_SEARCH_QUOTA_COST,
+    }
+
+
+def trailer_key(title: str, year: str, imdb_id: Optional[str] = None, tmdb_id: Optional[int] = None) -> str:
+    """
+    Builds the persistent key for a trailer.
+
+    Args:
+        title: Movie title
+        year: Movie year
+        imdb_id: IMDb ID, preferred whenever known
+        tmdb_id: Accepted for signature compatibility; not part of the key
+
+    Returns:
+        The imdbID, or the canonical title and year when it is unknown
+    """
+    return imdb_id or f"{canonicalize_title(title)}|{(year or '')[:4]}"
+
+
+def seed_trailer(imdb_id: str, trailer_url: str):
+    """Stores a trailer found elsewhere (e.g. appended TMDB videos) for `imdb_id`."""
+    try:
+        get_cache().set(TRAILERS_NAMESPACE, trailer_key('', '', imdb_id), trailer_url, TRAILER_CACHE_TTL)
+    except Exception:
+        pass  # Persisting is best effort
+
+
+def resolve_trailer(title: str, year: str, imdb_id: Optional[str],
+                    run: Callable[[Flow], Any], tmdb_id: Optional[int] = None) -> Optional[str]:
+    """
+    Resolves a trailer URL, from the persistent cache when possible.
+
+    Args:
+        title: Movie title
+        year: Movie year
+        imdb_id: IMDb ID used as the cache key, if known
+        run: Flow driver (api_handlers.run_flow)
+        tmdb_id: TMDB ID; enables the TMDB videos tier
+
+    Returns:
+        YouTube trailer URL or None; upstream errors propagate
+    """
+    key = trailer_key(title, year, imdb_id)
+    started = time.perf_counter()
+    try:
+        hit, trailer_url = get_cache().get(TRAILERS_NAMESPACE, key)
+    except Exception:
+        hit = False  # Treat an unreadable cache as a miss
+    if hit:
+        record_resolution('cache', time.perf_counter() - started)
+        return trailer_url
+
+    trailer_url, source = run(api_core.trailer_flow(title, year, tmdb_id))
+    record_resolution(source, time.perf_counter() - started)
+
+    try:
+        get_cache().set(TRAILERS_NAMESPACE, key, trailer_url, TRAILER_CACHE_TTL if trailer_url else TRAILER_MISS_TTL)
+    except Exception:
+        pass  # Persisting is best effort
+    return trailer_url
@@ -0,0 +1,99 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          TRENDING FEED MODULE
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+# One background job per process refreshes trending movies every
+# TRENDING_CACHE_TTL seconds and publishes an immutable snapshot of
+# ready-to-render display entries. Sessions read the current snapshot with
+# a single reference load, so rendering the trending section never waits
+# on TMDB or on a lock.
+
+import time
+from types import MappingProxyType
+from typing import Dict, List, Mapping, NamedTuple, Tuple
+import api_core
+from api_handlers import fetch_trending_movies, run_flow
+from config import TRENDING_CACHE_TTL
+from poster_palette import precompute_palettes
+from scheduler import schedule
+from suggestion_index import suggestion_index
+
+
+class TrendingSnapshot(NamedTuple):
+    movies: Tuple[Mapping, ...]
+    refreshed_at: float
+
+
+def build_display_entries(movies: List[Dict]) -> Tuple[Mapping, ...]:
+    """
+    Freezes trending dicts with everything the UI derives from them.
+
+    Adds 'poster_large' (200px rendition), 'label' (sidebar button text)
+    and 'caption' (card caption) next to the fetcher's
+    {id, title, year, poster, rating} fields.
+
+    Args:
+        movies: Result of the trending flow
+
+    Returns:
+        Tuple of read-only mappings
+    """
+    entries = []
+    for movie in movies:
+        title = movie['title']
+        poster = movie.get('poster')
+        entries.append(MappingProxyType({
+            **movie,
+            'poster_large': poster.replace('/w92/', '/w200/') if poster else None,
+            'label': f"{title[:22]}{'...' if len(title) > 22 else ''} ⭐{movie['rating']}",
+            'caption': title[:15] + "..." if len(title) > 15 else title,
+        }))
+    return tuple(entries)
+
+
+def _initial_snapshot() -> TrendingSnapshot:
+    """Starts from the persisted trending list, however stale, so the first render has content."""
+    hit, movies = fetch_trending_movies.peek()
+    return TrendingSnapshot(build_display_entries(movies) if hit else (), 0.0)
+
+
+_snapshot = _initial_snapshot()
+_started = False
+
+
+def refresh_trending():
+    """Fetches trending movies and publishes a new snapshot (scheduler job)."""
+    global _snapshot
+    movies = run_flow(api_core.trending_movies_flow())
+    suggestion_index.add(movies)
+    fetch_trending_movies.seed(movies)
+    _snapshot = TrendingSnapshot(build_display_entries(movies), time.time())
+    precompute_palettes(movie['poster'] for movie in movies)
+
+
+def start_trending_feed():
+    """Starts the background refresher once per process."""
+    global _started
+    schedule('trending', TRENDING_CACHE_TTL, refresh_trending)  # Idempotent, so a racing second call is harmless
+    _started = True
+
+
+def get_trending_snapshot() -> TrendingSnapshot:
+    """
+    Returns the latest published snapshot without blocking.
+
+    The first call in a process starts the background refresher; later
+    calls only read the flag and the snapshot reference.
+
+    Returns:
+        TrendingSnapshot; `movies` is empty until the first refresh lands
+        when nothing was persisted
+    """
+    if not _started:
+        start_trending_feed()
+    return _snapshot
+
+
+def get_trending_movies() -> Tuple[Mapping, ...]:
+    """Returns the current trending display entries."""
+    return get_trending_snapshot().movies
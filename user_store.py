@@ -0,0 +1,206 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          USER STORE MODULE
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+# Server-side SQLite store for per-user movie lists (search history and
+# favorites), so they survive reloads and restarts. Rows are indexed by
+# (user, list, added_at) and (user, list, title), so membership checks and
+# the first sidebar page cost the same for 20 favorites or 10,000.
+
+import os
+import sqlite3
+import threading
+from typing import List, Optional
+from config import USER_STORE_PATH
+from movie_collections import MovieEntry
+from title_index import canonicalize_title
+
+_COLUMNS = "key, imdb_id, title, year, poster, rating, added_at"
+
+
+def _entry_from_row(row: tuple) -> MovieEntry:
+    _, imdb_id, title, year, poster, rating, added_at = row
+    return MovieEntry(imdb_id, title, year, poster, rating, added_at)
+
+
+class UserStore:
+    """
+    SQLite table of (uid, list, movie) rows, newest first per list.
+
+    One connection is shared across sessions behind a lock, like the
+    persistent response cache.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS user_movies (
+                    uid       TEXT NOT NULL,
+                    list      TEXT NOT NULL,
+                    key       TEXT NOT NULL,
+                    imdb_id   TEXT NOT NULL,
+                    title     TEXT NOT NULL,
+                    title_key TEXT NOT NULL,
+                    year      TEXT,
+                    poster    TEXT,
+                    rating    TEXT,
+                    added_at  REAL NOT NULL,
+                    PRIMARY KEY (uid, list, key)
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_user_movies_recent ON user_movies (uid, list, added_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_user_movies_title ON user_movies (uid, list, title_key)")
+            self._conn = conn
+        return self._conn
+
+    def find(self, uid: str, name: str, key_or_title: str) -> Optional[MovieEntry]:
+        """Returns the entry for an imdbID/primary key or a title, if stored."""
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                f"SELECT {_COLUMNS} FROM user_movies WHERE uid = ? AND list = ? AND key = ?",
+                (uid, name, key_or_title)
+            ).fetchone()
+            if row is None:
+                row = conn.execute(
+                    f"SELECT {_COLUMNS} FROM user_movies WHERE uid = ? AND list = ? AND title_key = ? "
+                    "ORDER BY added_at DESC LIMIT 1",
+                    (uid, name, canonicalize_title(key_or_title))
+                ).fetchone()
+        return _entry_from_row(row) if row is not None else None
+
+    def add(self, uid: str, name: str, entry: MovieEntry) -> bool:
+        """Stores an entry as the newest of its list; returns True if it was not stored before."""
+        with self._lock:
+            conn = self._connect()
+            is_new = conn.execute(
+                "SELECT 1 FROM user_movies WHERE uid = ? AND list = ? AND key = ?", (uid, name, entry.key)
+            ).fetchone() is None
+            conn.execute(
+                "INSERT OR REPLACE INTO user_movies "
+                "(uid, list, key, imdb_id, title, title_key, year, poster, rating, added_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (uid, name, entry.key, entry.imdb_id, entry.title, canonicalize_title(entry.title),
+                 entry.year, entry.poster, entry.rating, entry.timestamp)
+            )
+        return is_new
+
+    def remove(self, uid: str, name: str, key: str) -> bool:
+        """Deletes one entry by primary key; returns whether it existed."""
+        with self._lock:
+            cursor = self._connect().execute(
+                "DELETE FROM user_movies WHERE uid = ? AND list = ? AND key = ?", (uid, name, key)
+            )
+        return cursor.rowcount > 0
+
+    def trim(self, uid: str, name: str, keep: int):
+        """Deletes all but the `keep` newest entries of a list."""
+        with self._lock:
+            self._connect().execute(
+                "DELETE FROM user_movies WHERE rowid IN (SELECT rowid FROM user_movies "
+                "WHERE uid = ? AND list = ? ORDER BY added_at DESC LIMIT -1 OFFSET ?)",
+                (uid, name, keep)
+            )
+
+    def clear(self, uid: str, name: str):
+        """Deletes every entry of a list."""
+        with self._lock:
+            self._connect().execute("DELETE FROM user_movies WHERE uid = ? AND list = ?", (uid, name))
+
+    def count(self, uid: str, name: str) -> int:
+        """Returns the number of entries in a list."""
+        with self._lock:
+            return self._connect().execute(
+                "SELECT COUNT(*) FROM user_movies WHERE uid = ? AND list = ?", (uid, name)
+            ).fetchone()[0]
+
+    def page(self, uid: str, name: str, offset: int, limit: int) -> List[MovieEntry]:
+        """Returns up to `limit` entries of a list, newest first, skipping `offset`."""
+        with self._lock:
+            rows = self._connect().execute(
+                f"SELECT {_COLUMNS} FROM user_movies WHERE uid = ? AND list = ? "
+                "ORDER BY added_at DESC LIMIT ? OFFSET ?",
+                (uid, name, limit, offset)
+            ).fetchall()
+        return [_entry_from_row(row) for row in rows]
+
+    def open_list(self, uid: str, name: str, capacity: int) -> 'UserList':
+        """Returns a MovieCollection-compatible view of one user's list."""
+        return UserList(self, uid, name, capacity)
+
+
+class UserList:
+    """
+    One user's list in the store, with the MovieCollection interface.
+
+    Nothing is read until first use, and only one page is ever loaded at a
+    time. Counts and trims always go to the table, so several tabs sharing
+    a uid see the same list.
+    """
+
+    __slots__ = ('store', 'uid', 'name', 'capacity')
+
+    def __init__(self, store: UserStore, uid: str, name: str, capacity: int):
+        self.store = store
+        self.uid = uid
+        self.name = name
+        self.capacity = capacity
+
+    def find(self, key_or_title: str) -> Optional[MovieEntry]:
+        """Returns the entry for an imdbID or title, if present."""
+        return self.store.find(self.uid, self.name, key_or_title or '')
+
+    def __contains__(self, key_or_title: str) -> bool:
+        return self.find(key_or_title) is not None
+
+    def add(self, entry: MovieEntry) -> bool:
+        """
+        Stores an entry as the newest, replacing any entry with the same key.
+
+        Args:
+            entry: Entry to add
+
+        Returns:
+            True if the movie was not in the list before
+        """
+        is_new = self.store.add(self.uid, self.name, entry)
+        if is_new:
+            self.store.trim(self.uid, self.name, self.capacity)
+        return is_new
+
+    def remove(self, key_or_title: str) -> bool:
+        """Removes the entry for an imdbID or title; returns whether one existed."""
+        entry = self.find(key_or_title)
+        return entry is not None and self.store.remove(self.uid, self.name, entry.key)
+
+    def clear(self):
+        """Removes every entry."""
+        self.store.clear(self.uid, self.name)
+
+    def page(self, offset: int, limit: int) -> List[MovieEntry]:
+        """Returns up to `limit` entries, newest first, skipping `offset`."""
+        return self.store.page(self.uid, self.name, offset, limit)
+
+    def __len__(self) -> int:
+        return self.store.count(self.uid, self.name)
+
+    def __repr__(self) -> str:
+        return f"UserList({self.uid!r}, {self.name!r})"
+
+
+_store = UserStore(USER_STORE_PATH)
+
+
+def get_user_store() -> UserStore:
+    """Returns the process-wide user store."""
+    return _store